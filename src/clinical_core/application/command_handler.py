@@ -12,11 +12,15 @@ The handler contains NO domain logic. It loads, delegates, and persists.
 
 from __future__ import annotations
 
+from collections import OrderedDict
+from dataclasses import replace
 from typing import Any
-from uuid import UUID, uuid4
+from uuid import UUID
 
 from clinical_core.domain.aggregate import Aggregate
-from clinical_core.domain.events import DomainEvent, EventMetadata
+from clinical_core.domain.events import ConcurrencyError, DomainEvent
+
+_DEFAULT_CACHE_SIZE = 1024
 
 
 class CommandHandler:
@@ -24,6 +28,10 @@ class CommandHandler:
 
     Orchestrates the full command flow:
       load stream → rehydrate → execute → persist → dispatch
+
+    Rehydrated states are kept in an LRU cache of up to cache_size
+    aggregates, keyed by aggregate_id and stored with the version they
+    reflect. A cached aggregate only replays the events after that version.
     """
 
     def __init__(
@@ -31,10 +39,13 @@ class CommandHandler:
         event_store: Any,
         dispatcher: Any,
         aggregate: Aggregate,
+        cache_size: int = _DEFAULT_CACHE_SIZE,
     ) -> None:
         self._event_store = event_store
         self._dispatcher = dispatcher
         self._aggregate = aggregate
+        self._cache: OrderedDict[UUID, tuple[Any, int]] = OrderedDict()
+        self._cache_size = cache_size
 
     def handle(self, command: Any, aggregate_id: UUID) -> list[DomainEvent]:
         """Handle a command against a specific aggregate instance.
@@ -43,50 +54,79 @@ class CommandHandler:
         Raises DomainError if the aggregate rejects the command.
         Raises ConcurrencyError if the event store detects a version conflict.
         """
-        # 1. Load the aggregate's event stream
-        stream = self._event_store.read_stream(aggregate_id)
-
-        # 2. Rehydrate aggregate state
-        state = self._aggregate.rehydrate(stream)
-        current_version = self._event_store.stream_version(aggregate_id)
-
+        # A creator command on an uncached aggregate first runs against the
+        # initial state, unread. If the stream already exists the append
+        # conflicts, and the command is decided again against the real state
+        # below, so the aggregate reports its own rejection.
+        if (type(command) in self._aggregate.creator_commands
+                and aggregate_id not in self._cache):
+            try:
+                return self._decide(
+                    command, aggregate_id, self._aggregate.initial_state(), 0,
+                )
+            except ConcurrencyError:
+                pass
+
+        # 1-2. Load and rehydrate the aggregate (cached state + tail)
+        state, current_version = self._load(aggregate_id)
+        return self._decide(command, aggregate_id, state, current_version)
+
+    def _decide(
+        self, command: Any, aggregate_id: UUID, state: Any, current_version: int,
+    ) -> list[DomainEvent]:
+        """Execute, persist and dispatch the command against a loaded state."""
         # 3. Execute domain logic (may raise DomainError)
         new_events = self._aggregate.execute(state, command)
 
         # 4. Assign final event metadata (version, event_id) and persist
-        persisted: list[DomainEvent] = []
-        for i, event in enumerate(new_events):
-            versioned = _set_version(event, current_version + i + 1)
-            result = self._event_store.append(versioned)
-            persisted.append(result)
+        versioned = [
+            _set_version(event, current_version + i)
+            for i, event in enumerate(new_events, start=1)
+        ]
+        try:
+            persisted = self._event_store.append_many(
+                versioned, expected_version=current_version,
+            )
+        except ConcurrencyError:
+            self._cache.pop(aggregate_id, None)
+            raise
+
+        # The version we wrote is where the next load picks up from.
+        self._remember(
+            aggregate_id,
+            self._aggregate.rehydrate_from(state, persisted),
+            current_version + len(persisted),
+        )
 
         # 5. Dispatch persisted events to projections
-        for event in persisted:
-            self._dispatcher.dispatch(event)
+        self._dispatcher.dispatch_batch(persisted)
 
         return persisted
 
+    def _load(self, aggregate_id: UUID) -> tuple[Any, int]:
+        """Return the aggregate's current state and version."""
+        cached = self._cache.get(aggregate_id)
+        if cached is None:
+            stream = self._event_store.read_stream(aggregate_id)
+            state = self._aggregate.rehydrate(stream)
+            version = stream[-1].aggregate_version if stream else 0
+        else:
+            state, version = cached
+            tail = self._event_store.read_stream_from(aggregate_id, version + 1)
+            if tail:
+                state = self._aggregate.rehydrate_from(state, tail)
+                version = tail[-1].aggregate_version
+        self._remember(aggregate_id, state, version)
+        return state, version
+
+    def _remember(self, aggregate_id: UUID, state: Any, version: int) -> None:
+        """Store a state in the LRU cache, evicting the least recently used."""
+        self._cache[aggregate_id] = (state, version)
+        self._cache.move_to_end(aggregate_id)
+        if len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
 
 def _set_version(event: DomainEvent, version: int) -> DomainEvent:
     """Return a new event with the correct aggregate_version."""
-    m = event.metadata
-    new_metadata = EventMetadata(
-        event_id=m.event_id,
-        event_type=m.event_type,
-        schema_version=m.schema_version,
-        aggregate_id=m.aggregate_id,
-        aggregate_type=m.aggregate_type,
-        aggregate_version=version,
-        occurred_at=m.occurred_at,
-        performed_by=m.performed_by,
-        performer_role=m.performer_role,
-        organization_id=m.organization_id,
-        facility_id=m.facility_id,
-        device_id=m.device_id,
-        connection_status=m.connection_status,
-        correlation_id=m.correlation_id,
-        recorded_at=m.recorded_at,
-        causation_id=m.causation_id,
-        visibility=m.visibility,
-    )
-    return DomainEvent(metadata=new_metadata, payload=event.payload)
+    return replace(event, metadata=replace(event.metadata, aggregate_version=version))
@@ -1,7 +1,7 @@
 """Event Dispatcher — Pipeline Stages 3 + 4 (Publish + Route).
 
 Connects the event store to projection handlers. The dispatcher:
-- Maintains a registry of subscriptions (event_type → list of callables).
+- Maintains a registry of subscriptions (event_type → tuple of callables).
 - Dispatches events to all matching subscribers.
 - Has no knowledge of what handlers do internally.
 - Isolates handler failures — one failing handler does not block others.
@@ -11,8 +11,9 @@ Connects the event store to projection handlers. The dispatcher:
 from __future__ import annotations
 
 import logging
-from collections import defaultdict
-from typing import Callable
+import sys
+from typing import Callable, Iterable
+from uuid import UUID
 
 from clinical_core.domain.events import DomainEvent
 
@@ -29,11 +30,21 @@ class EventDispatcher:
     """
 
     def __init__(self) -> None:
-        self._subscriptions: dict[str, list[EventHandler]] = defaultdict(list)
+        # Handler tuples are replaced, never mutated, on subscribe: dispatch
+        # iterates an immutable snapshot and subscription is a cold path.
+        self._subscriptions: dict[str, tuple[EventHandler, ...]] = {}
 
     def subscribe(self, event_type: str, handler: EventHandler) -> None:
         """Register a handler for a specific event type."""
-        self._subscriptions[event_type].append(handler)
+        # Interned like the event types of built events, so lookups match
+        # by identity.
+        event_type = sys.intern(event_type)
+        self._subscriptions[event_type] = self._subscriptions.get(event_type, ()) + (handler,)
+
+    def subscribe_all(self, event_types: Iterable[str], handler: EventHandler) -> None:
+        """Register one handler for several event types (e.g. a projection)."""
+        for event_type in event_types:
+            self.subscribe(event_type, handler)
 
     def dispatch(self, event: DomainEvent) -> None:
         """Dispatch a single event to all matching subscribers.
@@ -41,7 +52,10 @@ class EventDispatcher:
         Handler failures are logged and isolated — they do not propagate
         or prevent other handlers from receiving the event.
         """
-        handlers = self._subscriptions.get(event.event_type, [])
+        try:
+            handlers = self._subscriptions[event.event_type]
+        except KeyError:
+            return
         for handler in handlers:
             try:
                 handler(event)
@@ -56,14 +70,44 @@ class EventDispatcher:
     def dispatch_batch(self, events: list[DomainEvent]) -> None:
         """Dispatch a batch of events with deterministic ordering.
 
-        Events are sorted by (aggregate_id, aggregate_version) before
-        dispatch, ensuring that within each aggregate stream, events
-        arrive in version order. This is critical for projection
-        correctness after offline sync.
+        Events are grouped by aggregate_id, in order of each aggregate's
+        first appearance, and each group is dispatched in aggregate_version
+        order. Within each aggregate stream, events therefore arrive in
+        version order. This is critical for projection correctness after
+        offline sync.
+
+        Events of types with no subscribers when the batch starts are
+        skipped before grouping, so they cost one dict lookup each.
         """
-        sorted_events = sorted(
-            events,
-            key=lambda e: (e.aggregate_id, e.aggregate_version),
-        )
-        for event in sorted_events:
-            self.dispatch(event)
+        if len(events) == 1:
+            # One command, one event: nothing to group or order.
+            self.dispatch(events[0])
+            return
+
+        subscriptions = self._subscriptions
+        buckets: dict[UUID, list[DomainEvent]] = {}
+        for event in events:
+            if event.event_type in subscriptions:
+                buckets.setdefault(event.aggregate_id, []).append(event)
+
+        dispatch = self.dispatch
+        for bucket in buckets.values():
+            if not _in_version_order(bucket):
+                bucket.sort(key=_version_key)
+            for event in bucket:
+                dispatch(event)
+
+
+def _version_key(event: DomainEvent) -> int:
+    return event.aggregate_version
+
+
+def _in_version_order(bucket: list[DomainEvent]) -> bool:
+    """True if the events are already in ascending version order."""
+    previous = 0
+    for event in bucket:
+        version = event.aggregate_version
+        if version < previous:
+            return False
+        previous = version
+    return True
@@ -15,12 +15,15 @@ No framework coupling — requests are plain dicts.
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import json
+import sys
+from dataclasses import dataclass, field, fields
 from datetime import datetime, timezone
-from typing import Any, Callable
+from typing import Any, Callable, get_type_hints
 from uuid import UUID
 
 from clinical_core.domain.aggregate import DomainError
+from clinical_core.domain.diagnosis import ConfirmDiagnosis
 from clinical_core.domain.events import (
     ConnectionStatus,
     ConcurrencyError,
@@ -39,13 +42,22 @@ class GatewayResult:
     error: str = ""
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class _CommandRegistration:
-    """Internal: maps a command_type to its handler and config."""
+    """Internal: maps a command_type to its handler and parsing plan.
+
+    Everything handle() needs is worked out once, at register() time:
+    the required keys as a frozenset for one set difference, and the
+    command's constructor arguments as (field_name, parser) pairs in
+    positional order, with parser None for values passed through as-is.
+    """
     handler: Any
     aggregate_id_field: str
-    required_fields: list[str]
-    uuid_fields: list[str]
+    required_fields: tuple[str, ...]
+    required: frozenset[str]
+    uuid_fields: frozenset[str]
+    command_class: type
+    parsers: tuple[tuple[str, Callable[[Any], Any] | None], ...]
 
 
 # Default field sets for the ConfirmDiagnosis command
@@ -81,18 +93,38 @@ class CommandGateway:
         required_fields: list[str] | None = None,
         uuid_fields: list[str] | None = None,
     ) -> None:
-        """Register a command type with its handler and field config."""
+        """Register a command type with its handler and field config.
+
+        aggregate_id_field must be one of the uuid_fields, so the
+        aggregate_id is already a UUID once the payload is validated.
+        Raises ValueError otherwise, or if command_type has no known
+        command dataclass.
+        """
         # Default field definitions per known command type
         if required_fields is None:
             required_fields = _KNOWN_REQUIRED.get(command_type, [])
         if uuid_fields is None:
             uuid_fields = _KNOWN_UUIDS.get(command_type, [])
+        if aggregate_id_field not in uuid_fields:
+            raise ValueError(
+                f"aggregate_id_field {aggregate_id_field!r} of {command_type} "
+                f"must be listed in uuid_fields"
+            )
+
+        command_class = _COMMANDS.get(command_type)
+        if command_class is None:
+            raise ValueError(f"No command class known for command type: {command_type}")
 
-        self._registrations[command_type] = _CommandRegistration(
+        # Interned, so lookups with the same string object short-circuit
+        # on identity.
+        self._registrations[sys.intern(command_type)] = _CommandRegistration(
             handler=handler,
             aggregate_id_field=aggregate_id_field,
-            required_fields=required_fields,
-            uuid_fields=uuid_fields,
+            required_fields=tuple(required_fields),
+            required=frozenset(required_fields),
+            uuid_fields=frozenset(uuid_fields),
+            command_class=command_class,
+            parsers=_build_parsers(command_class, uuid_fields),
         )
 
     def handle(self, request: dict[str, Any]) -> GatewayResult:
@@ -105,58 +137,63 @@ class CommandGateway:
         except Exception as e:
             return GatewayResult(success=False, error=str(e))
 
+    def handle_bytes(self, body: bytes | str) -> GatewayResult:
+        """Decode a JSON request body and process it like handle().
+
+        For transports that deliver raw JSON. Field parsing is the same
+        precompiled plan as for dicts. Never raises exceptions.
+        """
+        try:
+            request = json.loads(body)
+        except (TypeError, ValueError, RecursionError) as e:
+            return GatewayResult(success=False, error=f"Malformed JSON request: {e}")
+        if not isinstance(request, dict):
+            return GatewayResult(success=False, error="Request must be a JSON object")
+        return self.handle(request)
+
     def _handle_inner(self, request: dict[str, Any]) -> GatewayResult:
-        # Step 1: Validate request envelope
-        if "command_type" not in request:
+        # Steps 1-2: Validate request envelope and look up the command type,
+        # with a single branch on the happy path
+        command_type = request.get("command_type")
+        payload = request.get("payload")
+        try:
+            reg = self._registrations.get(command_type)
+        except TypeError:  # unhashable command_type
+            reg = None
+        if reg is None or not isinstance(payload, dict):
             return GatewayResult(
                 success=False,
-                error="Missing required field: command_type",
+                error=_envelope_error(command_type, payload, reg),
             )
-        if "payload" not in request:
+
+        # Step 3: Validate input shape (required fields)
+        missing = reg.required - payload.keys()
+        if missing:
+            # Report the first missing field in declared order.
+            field_name = next(f for f in reg.required_fields if f in missing)
             return GatewayResult(
                 success=False,
-                error="Missing required field: payload",
+                error=f"Missing required field in payload: {field_name}",
             )
 
-        command_type = request["command_type"]
-        payload = request["payload"]
-
-        # Step 2: Check command type is registered
-        if command_type not in self._registrations:
+        # Steps 4-5: Parse typed fields and map request → command
+        args: list[Any] = []
+        field_name = ""
+        try:
+            for field_name, parse in reg.parsers:
+                value = payload[field_name]
+                args.append(value if parse is None else parse(value))
+        except (ValueError, AttributeError):
+            if field_name not in reg.uuid_fields:
+                raise
             return GatewayResult(
                 success=False,
-                error=f"Unknown command type: {command_type}",
+                error=f"Invalid UUID for field: {field_name}",
             )
+        command = reg.command_class(*args)
 
-        reg = self._registrations[command_type]
-
-        # Step 3: Validate input shape (required fields)
-        for field_name in reg.required_fields:
-            if field_name not in payload:
-                return GatewayResult(
-                    success=False,
-                    error=f"Missing required field in payload: {field_name}",
-                )
-
-        # Step 4: Validate UUID fields
-        parsed: dict[str, Any] = dict(payload)
-        for field_name in reg.uuid_fields:
-            if field_name in parsed:
-                try:
-                    parsed[field_name] = UUID(str(parsed[field_name]))
-                except (ValueError, AttributeError):
-                    return GatewayResult(
-                        success=False,
-                        error=f"Invalid UUID for field: {field_name}",
-                    )
-
-        # Step 5: Map request → command
-        command = _map_command(command_type, parsed)
-
-        # Step 6: Extract aggregate_id and route to handler
-        aggregate_id = parsed[reg.aggregate_id_field]
-        if not isinstance(aggregate_id, UUID):
-            aggregate_id = UUID(str(aggregate_id))
+        # Step 6: Extract aggregate_id (a UUID after parsing) and route
+        aggregate_id = getattr(command, reg.aggregate_id_field)
 
         try:
             events = reg.handler.handle(command, aggregate_id=aggregate_id)
@@ -167,45 +204,79 @@ class CommandGateway:
             return GatewayResult(success=False, error=str(e))
 
 
+def _envelope_error(
+    command_type: Any, payload: Any, reg: _CommandRegistration | None
+) -> str:
+    """Describe why a request envelope was rejected (unhappy path only)."""
+    if command_type is None:
+        return "Missing required field: command_type"
+    if payload is None:
+        return "Missing required field: payload"
+    if reg is None:
+        return f"Unknown command type: {command_type}"
+    # A payload that is not an object has none of the required fields.
+    if reg.required_fields:
+        return f"Missing required field in payload: {reg.required_fields[0]}"
+    return "Payload must be a JSON object"
+
+
 # ---------------------------------------------------------------------------
-# Command mappers
+# Payload parsing
 # ---------------------------------------------------------------------------
 
-def _map_command(command_type: str, parsed: dict[str, Any]) -> Any:
-    """Map a parsed payload dict to a frozen command dataclass."""
-    mapper = _MAPPERS.get(command_type)
-    if mapper is None:
-        raise ValueError(f"No mapper registered for command type: {command_type}")
-    return mapper(parsed)
-
-
-def _map_confirm_diagnosis(p: dict[str, Any]) -> Any:
-    from clinical_core.domain.diagnosis import ConfirmDiagnosis
-
-    return ConfirmDiagnosis(
-        diagnosis_id=_uuid(p, "diagnosis_id"),
-        encounter_id=_uuid(p, "encounter_id"),
-        patient_id=_uuid(p, "patient_id"),
-        condition=p["condition"],
-        icd_code=p["icd_code"],
-        occurred_at=_datetime(p, "occurred_at"),
-        performed_by=_uuid(p, "performed_by"),
-        performer_role=p["performer_role"],
-        organization_id=_uuid(p, "organization_id"),
-        facility_id=_uuid(p, "facility_id"),
-        device_id=p["device_id"],
-        connection_status=ConnectionStatus(p["connection_status"]),
-        correlation_id=_uuid(p, "correlation_id"),
+def _build_parsers(
+    command_class: type,
+    uuid_fields: list[str],
+) -> tuple[tuple[str, Callable[[Any], Any] | None], ...]:
+    """Build the (field_name, parser) plan for one command dataclass.
+
+    Introspects the dataclass fields once, at register() time. Fields
+    listed in uuid_fields parse as UUIDs; the rest parse by annotation,
+    and annotations without a parser pass the raw value through.
+    """
+    try:
+        hints = get_type_hints(command_class)
+    except NameError:
+        # Some annotation names a type not resolvable yet (e.g. one imported
+        # only under TYPE_CHECKING): fall back to the annotation strings.
+        hints = {}
+    return tuple(
+        (f.name, _parser_for(f.name, hints.get(f.name, f.type), uuid_fields))
+        for f in fields(command_class)
     )
 
 
-def _uuid(p: dict, key: str) -> UUID:
-    v = p[key]
-    return v if isinstance(v, UUID) else UUID(str(v))
+def _parser_for(
+    field_name: str, annotation: Any, uuid_fields: list[str],
+) -> Callable[[Any], Any] | None:
+    if field_name in uuid_fields:
+        return _uuid
+    if field_name in _INTERNED_FIELDS:
+        return _interned
+    if isinstance(annotation, str):
+        return _PARSERS_BY_NAME.get(annotation)
+    return _PARSERS.get(annotation)
+
+
+def _uuid(v: Any) -> UUID:
+    t = type(v)
+    if t is UUID:
+        return v
+    if t is str:
+        return UUID(v)
+    return UUID(str(v))
+
+
+def _interned(v: Any) -> Any:
+    return sys.intern(v) if type(v) is str else v
 
 
-def _datetime(p: dict, key: str) -> datetime:
-    v = p[key]
+def _datetime(v: Any) -> datetime:
+    t = type(v)
+    if t is datetime:
+        return v
+    if t is str:
+        return datetime.fromisoformat(v)
     if isinstance(v, datetime):
         return v
     return datetime.fromisoformat(str(v))
@@ -215,10 +286,26 @@ def _datetime(p: dict, key: str) -> datetime:
 # Registry tables
 # ---------------------------------------------------------------------------
 
-_MAPPERS: dict[str, Callable] = {
-    "ConfirmDiagnosis": _map_confirm_diagnosis,
+_COMMANDS: dict[str, type] = {
+    "ConfirmDiagnosis": ConfirmDiagnosis,
+}
+
+# annotation → parser for the raw payload value.
+_PARSERS: dict[Any, Callable[[Any], Any]] = {
+    UUID: _uuid,
+    datetime: _datetime,
+    ConnectionStatus: ConnectionStatus,
+}
+
+# annotation string → parser, for annotations that could not be resolved.
+_PARSERS_BY_NAME: dict[str, Callable[[Any], Any]] = {
+    annotation.__name__: parser for annotation, parser in _PARSERS.items()
 }
 
+# Context strings repeated on every command from a device. Interned as they
+# are parsed, so the events built from them share one copy of each.
+_INTERNED_FIELDS = frozenset({"performer_role", "device_id"})
+
 _KNOWN_REQUIRED: dict[str, list[str]] = {
     "ConfirmDiagnosis": _CONFIRM_DIAGNOSIS_REQUIRED,
 }
@@ -1,25 +1,71 @@
 """Projection Handler abstraction — Pipeline Stage 5.
 
 Base class for all projections. A projection is a derived, rebuildable
-view of events. It folds events into an in-memory state dict.
+view of events. It folds events into an in-memory state (a dict unless
+the subclass chooses another shape).
 
 Requirements:
 - Receives events via handle().
 - Updates projection state via a pure _apply() fold function.
-- Tracks processed event IDs for idempotent processing.
+- Tracks processed event IDs for idempotent processing, or, in bounded
+  mode, the highest applied version per aggregate.
 - Rebuilds entirely from event history via rebuild_from().
+- Keeps a checkpoint (a position in the event store's global order) and
+  catches up from it via catch_up().
+- Rebuilds from a snapshot plus the events after its checkpoint, when one
+  is available.
 - Stateless processing logic: _apply depends only on current state + event.
 - Declares subscribed event types so the dispatcher can route correctly.
 """
 
 from __future__ import annotations
 
+import copy
 from abc import ABC, abstractmethod
-from typing import Any
+from dataclasses import dataclass, field
+from typing import Any, Protocol
 from uuid import UUID
 
 from clinical_core.domain.events import DomainEvent
 
+_DEFAULT_SNAPSHOT_EVERY = 100
+
+
+@dataclass(frozen=True)
+class ProjectionSnapshot:
+    """A projection's state as of event store position `checkpoint`.
+
+    checkpoint counts the events of the store's global order (see
+    EventStore.read_all_events) that the state covers. The deduplication
+    record comes along, so a restored projection still skips every event
+    it has applied, whether redelivered live or reached by catch-up: the
+    processed event IDs, or, in bounded mode, the highest applied version
+    per aggregate.
+    """
+    state: Any
+    checkpoint: int
+    processed_event_ids: frozenset[UUID] = field(default_factory=frozenset)
+    applied_versions: dict[UUID, int] = field(default_factory=dict)
+
+
+class ProjectionSnapshotStore(Protocol):
+    """Port for projection snapshot persistence.
+
+    Separate from the aggregate SnapshotStore: projections are keyed by
+    name and positioned by a checkpoint, not by an aggregate version.
+
+    Implementations must satisfy:
+    - Latest wins: save() replaces any earlier snapshot for the projection.
+    """
+
+    def load(self, projection_name: str) -> ProjectionSnapshot | None:
+        """Return the latest snapshot of a projection, or None if there is none."""
+        ...
+
+    def save(self, projection_name: str, snapshot: ProjectionSnapshot) -> None:
+        """Store a projection snapshot."""
+        ...
+
 
 class ProjectionHandler(ABC):
     """Abstract base for projection handlers.
@@ -27,52 +73,190 @@ class ProjectionHandler(ABC):
     Subclasses implement:
     - subscribed_event_types: which event types this projection cares about.
     - _apply(state, event) -> new_state: the pure fold function.
+
+    rebuild_from() and catch_up() read events in the store's global order
+    and advance the checkpoint past them, skipping events already applied
+    through handle(). The checkpoint only moves there, so a live projection
+    fed by the dispatcher should still call catch_up() periodically: that
+    is what picks up events whose dispatch failed, and what saves snapshots.
+
+    If a snapshot_store (a ProjectionSnapshotStore) is given, rebuild_from()
+    and catch_up() save a snapshot at their end once snapshot_every events
+    have been applied since the last one. handle() never saves snapshots:
+    a live projection is checkpointed by its periodic catch-up.
+
+    By default every processed event_id is remembered, so memory grows
+    with the number of events. With dedupe_by_version=True only the
+    highest applied aggregate_version per aggregate is kept, and an event
+    at or below it is treated as a duplicate. That bounds memory by the
+    number of aggregates, but relies on each aggregate's events arriving
+    in version order — which dispatch_batch and catch-up reads guarantee.
     """
 
-    def __init__(self) -> None:
-        self._state: dict[str, Any] = {}
+    def __init__(
+        self,
+        snapshot_store: Any = None,
+        snapshot_every: int = _DEFAULT_SNAPSHOT_EVERY,
+        dedupe_by_version: bool = False,
+    ) -> None:
+        self._state: Any = self._initial_state()
         self._processed_event_ids: set[UUID] = set()
+        self._applied_versions: dict[UUID, int] = {}
+        self._dedupe_by_version = dedupe_by_version
+        self._subscribed: frozenset[str] = frozenset(self.subscribed_event_types)
+        self._snapshot_store = snapshot_store
+        self._snapshot_every = snapshot_every
+        self._events_since_snapshot = 0
+        self._checkpoint = 0
 
     @property
-    def state(self) -> dict[str, Any]:
+    def state(self) -> Any:
         """Current projection state. Read-only access for queries."""
         return self._state
 
+    @property
+    def checkpoint(self) -> int:
+        """Number of events of the store's global order the state covers."""
+        return self._checkpoint
+
+    @property
+    def projection_name(self) -> str:
+        """Name under which snapshots of this projection are stored."""
+        return type(self).__name__
+
     @property
     @abstractmethod
     def subscribed_event_types(self) -> list[str]:
         """Event types this projection consumes."""
         ...
 
+    def _initial_state(self) -> Any:
+        """Return the empty state before any events. Defaults to an empty dict.
+
+        Subclasses that fold into fixed containers override this so that
+        _apply can update those containers in place. The state need not be
+        a dict: a projection may use any deep-copyable object, as long as
+        its query mappers read it the same way.
+        """
+        return {}
+
     @abstractmethod
-    def _apply(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
-        """Pure fold function: (current_state, event) -> new_state.
+    def _apply(self, state: Any, event: DomainEvent) -> Any:
+        """Fold function: (current_state, event) -> new_state.
 
-        Must be deterministic and side-effect-free. Must not read from
-        external sources or modify instance fields beyond returning
-        the new state dict.
+        Must be deterministic. Must not read from external sources or
+        modify instance fields beyond returning the new state dict.
+        Implementations may update the given state in place and return
+        it — handle() is the only caller that owns the state.
         """
         ...
 
     def handle(self, event: DomainEvent) -> None:
         """Process a single event. Skips unsubscribed types and duplicates."""
-        if event.event_type not in self.subscribed_event_types:
+        if event.event_type not in self._subscribed:
             return
 
-        if event.event_id in self._processed_event_ids:
-            return
+        if self._dedupe_by_version:
+            aggregate_id = event.aggregate_id
+            version = event.aggregate_version
+            if version <= self._applied_versions.get(aggregate_id, 0):
+                return
+            self._state = self._apply(self._state, event)
+            self._applied_versions[aggregate_id] = version
+        else:
+            if event.event_id in self._processed_event_ids:
+                return
+            self._state = self._apply(self._state, event)
+            self._processed_event_ids.add(event.event_id)
+
+    def save_snapshot(self) -> ProjectionSnapshot:
+        """Capture the current state and checkpoint.
+
+        The snapshot is a deep copy: later events do not alter it, even
+        when _apply updates the live state in place.
+        """
+        return ProjectionSnapshot(
+            state=copy.deepcopy(self._state),
+            checkpoint=self._checkpoint,
+            processed_event_ids=frozenset(self._processed_event_ids),
+            applied_versions=dict(self._applied_versions),
+        )
 
-        self._state = self._apply(self._state, event)
-        self._processed_event_ids.add(event.event_id)
+    def load_snapshot(self, snapshot: ProjectionSnapshot) -> None:
+        """Replace the current state, checkpoint and deduplication record."""
+        self._state = copy.deepcopy(snapshot.state)
+        self._checkpoint = snapshot.checkpoint
+        self._processed_event_ids = set(snapshot.processed_event_ids)
+        self._applied_versions = dict(snapshot.applied_versions)
+        self._events_since_snapshot = 0
 
-    def rebuild_from(self, events: list[DomainEvent]) -> None:
+    def rebuild_from(
+        self,
+        events: list[DomainEvent],
+        snapshot: ProjectionSnapshot | None = None,
+    ) -> None:
         """Rebuild projection state entirely from a list of events.
 
-        Clears all existing state and processed event IDs, then replays
-        each event through handle(). This guarantees the projection
-        converges to the correct state regardless of prior history.
+        events is the store's full history in global order. Clears all
+        existing state, then replays each event with the same filtering
+        and deduplication as handle(), and sets the checkpoint past the
+        last one. This guarantees the projection converges to the correct
+        state regardless of prior history.
+
+        If a snapshot is given, starts from it instead of the initial
+        state and replays only the events after its checkpoint.
         """
-        self._state = {}
-        self._processed_event_ids = set()
-        for event in events:
-            self.handle(event)
+        if snapshot is not None:
+            self.load_snapshot(snapshot)
+            events = events[self._checkpoint:]
+        else:
+            self._state = self._initial_state()
+            self._processed_event_ids = set()
+            self._applied_versions = {}
+            self._events_since_snapshot = 0
+            self._checkpoint = 0
+        self._fold_from_checkpoint(events)
+
+    def catch_up(self, event_store: Any) -> None:
+        """Apply the events appended to event_store since the checkpoint."""
+        self._fold_from_checkpoint(event_store.read_all_events_from(self._checkpoint))
+
+    def _fold_from_checkpoint(self, events: list[DomainEvent]) -> None:
+        """Fold the events that follow the checkpoint and advance it past them."""
+        # Same checks as handle(), with everything bound to locals: this
+        # loop runs once per event in the full history.
+        subscribed = self._subscribed
+        apply = self._apply
+        state = self._state
+        applied = 0
+        if self._dedupe_by_version:
+            applied_versions = self._applied_versions
+            for event in events:
+                if event.event_type not in subscribed:
+                    continue
+                aggregate_id = event.aggregate_id
+                version = event.aggregate_version
+                if version <= applied_versions.get(aggregate_id, 0):
+                    continue
+                state = apply(state, event)
+                applied_versions[aggregate_id] = version
+                applied += 1
+        else:
+            processed = self._processed_event_ids
+            for event in events:
+                if event.event_type not in subscribed:
+                    continue
+                event_id = event.event_id
+                if event_id in processed:
+                    continue
+                state = apply(state, event)
+                processed.add(event_id)
+                applied += 1
+        self._state = state
+        self._checkpoint += len(events)
+
+        if self._snapshot_store is not None and applied:
+            self._events_since_snapshot += applied
+            if self._events_since_snapshot >= self._snapshot_every:
+                self._snapshot_store.save(self.projection_name, self.save_snapshot())
+                self._events_since_snapshot = 0
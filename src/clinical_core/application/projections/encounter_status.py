@@ -0,0 +1,36 @@
+"""Encounter Status Projection.
+
+A derived view of each encounter's current lifecycle status, so that
+cross-aggregate checks (INV-CJ-1) can look a status up instead of
+replaying the encounter's stream.
+
+Consumes: every encounter event type listed in
+domain.diagnosis.ENCOUNTER_STATUS_AFTER.
+
+Produces (state):
+- dict[encounter_id → status], status one of
+  "checked_in", "active", "completed". Unknown encounters are "none".
+"""
+
+from __future__ import annotations
+
+from uuid import UUID
+
+from clinical_core.application.projection_handler import ProjectionHandler
+from clinical_core.domain.diagnosis import ENCOUNTER_STATUS_AFTER
+from clinical_core.domain.events import DomainEvent
+
+
+class EncounterStatusProjection(ProjectionHandler):
+
+    @property
+    def subscribed_event_types(self) -> list[str]:
+        return list(ENCOUNTER_STATUS_AFTER)
+
+    def _apply(self, state: dict[UUID, str], event: DomainEvent) -> dict[UUID, str]:
+        state[event.aggregate_id] = ENCOUNTER_STATUS_AFTER[event.event_type]
+        return state
+
+    def status_of(self, encounter_id: UUID) -> str:
+        """Current status of an encounter, or "none" if it has no events."""
+        return self._state.get(encounter_id, "none")
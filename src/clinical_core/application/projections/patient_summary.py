@@ -14,75 +14,90 @@ Produces (state keys):
 - active_treatments: dict[treatment_id → {treatment, diagnosis_id, patient_id}]
 - stopped_treatments: dict[treatment_id → {treatment, diagnosis_id, reason, patient_id}]
 - vitals: list[{recorded_at, readings, patient_id, encounter_id}]
+  (recorded_at is a datetime; query mappers format it for responses)
 """
 
 from __future__ import annotations
 
-from typing import Any
+from typing import Any, Callable
 
 from clinical_core.application.projection_handler import ProjectionHandler
-from clinical_core.domain.events import DomainEvent
-
-_DIAGNOSIS_CONFIRMED = "clinical.judgment.DiagnosisConfirmed"
-_TREATMENT_STARTED = "clinical.judgment.TreatmentStarted"
-_TREATMENT_STOPPED = "clinical.judgment.TreatmentStopped"
-_VITAL_SIGNS_RECORDED = "clinical.observation.VitalSignsRecorded"
+from clinical_core.domain.events import (
+    DIAGNOSIS_CONFIRMED,
+    TREATMENT_STARTED,
+    TREATMENT_STOPPED,
+    VITAL_SIGNS_RECORDED,
+    DomainEvent,
+)
 
 
 class PatientSummaryProjection(ProjectionHandler):
 
     @property
     def subscribed_event_types(self) -> list[str]:
-        return [
-            _DIAGNOSIS_CONFIRMED, _TREATMENT_STARTED, _TREATMENT_STOPPED,
-            _VITAL_SIGNS_RECORDED,
-        ]
+        return list(self._APPLY)
 
-    def _apply(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
-        active_conditions: dict[str, Any] = dict(state.get("active_conditions", {}))
-        active_treatments: dict[str, Any] = dict(state.get("active_treatments", {}))
-        stopped_treatments: dict[str, Any] = dict(state.get("stopped_treatments", {}))
-        vitals: list[dict[str, Any]] = list(state.get("vitals", []))
+    def _initial_state(self) -> dict[str, Any]:
+        return {
+            "active_conditions": {},
+            "active_treatments": {},
+            "stopped_treatments": {},
+            "vitals": [],
+        }
 
+    def _apply(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
+        # Collections are updated in place: copying them per event would make
+        # a rebuild quadratic in the size of the patient history.
+        apply = self._APPLY.get(event.event_type)
+        if apply is not None:
+            apply(state, event)
+        return state
+
+    @staticmethod
+    def _on_diagnosis_confirmed(state: dict[str, Any], event: DomainEvent) -> None:
         payload = event.payload
+        state["active_conditions"][payload["diagnosis_id"]] = {
+            "condition": payload["condition"],
+            "icd_code": payload["icd_code"],
+            "patient_id": payload.get("patient_id"),
+        }
 
-        if event.event_type == _DIAGNOSIS_CONFIRMED:
-            diagnosis_id = payload["diagnosis_id"]
-            active_conditions[diagnosis_id] = {
-                "condition": payload["condition"],
-                "icd_code": payload["icd_code"],
-                "patient_id": payload.get("patient_id"),
-            }
-
-        elif event.event_type == _TREATMENT_STARTED:
-            treatment_id = payload["treatment_id"]
-            active_treatments[treatment_id] = {
-                "treatment": payload["treatment"],
-                "diagnosis_id": payload.get("diagnosis_id"),
-                "patient_id": payload.get("patient_id"),
-            }
-
-        elif event.event_type == _TREATMENT_STOPPED:
-            treatment_id = payload["treatment_id"]
-            stopped_entry = {
-                "reason": payload.get("reason"),
-                "patient_id": payload.get("patient_id"),
-            }
-            if treatment_id in active_treatments:
-                stopped_entry.update(active_treatments.pop(treatment_id))
-            stopped_treatments[treatment_id] = stopped_entry
-
-        elif event.event_type == _VITAL_SIGNS_RECORDED:
-            vitals.append({
-                "recorded_at": str(event.metadata.occurred_at),
-                "readings": payload.get("readings", {}),
-                "patient_id": payload.get("patient_id"),
-                "encounter_id": payload.get("encounter_id"),
-            })
+    @staticmethod
+    def _on_treatment_started(state: dict[str, Any], event: DomainEvent) -> None:
+        payload = event.payload
+        state["active_treatments"][payload["treatment_id"]] = {
+            "treatment": payload["treatment"],
+            "diagnosis_id": payload.get("diagnosis_id"),
+            "patient_id": payload.get("patient_id"),
+        }
 
-        return {
-            "active_conditions": active_conditions,
-            "active_treatments": active_treatments,
-            "stopped_treatments": stopped_treatments,
-            "vitals": vitals,
+    @staticmethod
+    def _on_treatment_stopped(state: dict[str, Any], event: DomainEvent) -> None:
+        payload = event.payload
+        treatment_id = payload["treatment_id"]
+        stopped_entry = {
+            "reason": payload.get("reason"),
+            "patient_id": payload.get("patient_id"),
         }
+        active_treatments = state["active_treatments"]
+        if treatment_id in active_treatments:
+            stopped_entry.update(active_treatments.pop(treatment_id))
+        state["stopped_treatments"][treatment_id] = stopped_entry
+
+    @staticmethod
+    def _on_vital_signs_recorded(state: dict[str, Any], event: DomainEvent) -> None:
+        payload = event.payload
+        state["vitals"].append({
+            "recorded_at": event.metadata.occurred_at,
+            "readings": payload.get("readings", {}),
+            "patient_id": payload.get("patient_id"),
+            "encounter_id": payload.get("encounter_id"),
+        })
+
+    # event_type → fold step. Also the list of subscribed event types.
+    _APPLY: dict[str, Callable[[dict[str, Any], DomainEvent], None]] = {
+        DIAGNOSIS_CONFIRMED: _on_diagnosis_confirmed,
+        TREATMENT_STARTED: _on_treatment_started,
+        TREATMENT_STOPPED: _on_treatment_stopped,
+        VITAL_SIGNS_RECORDED: _on_vital_signs_recorded,
+    }
@@ -70,6 +70,21 @@ class QueryGateway:
         except Exception as e:
             return QueryResult(success=False, error=str(e))
 
+    def handle_trusted(self, query_type: str, params: dict[str, Any]) -> QueryResult:
+        """Run a query built by in-process code, skipping envelope checks.
+
+        For callers that already hold a str query_type and a dict of params.
+        Unknown query types still return a failed QueryResult; exceptions
+        from the mapper propagate to the caller.
+        """
+        reg = self._registrations.get(query_type)
+        if reg is None:
+            return QueryResult(
+                success=False,
+                error=f"Unknown query type: {query_type}",
+            )
+        return _run_query(reg, params)
+
     def _handle_inner(self, request: Any) -> QueryResult:
         # Step 1: Validate request envelope
         if not isinstance(request, dict):
@@ -104,9 +119,10 @@ class QueryGateway:
         if not isinstance(params, dict):
             params = {}
 
-        # Step 3: Fetch projection state and map to response
-        projection_state = reg.projection.state
-        response_data = reg.mapper(projection_state, params)
+        # Steps 3-4: Fetch projection state, map to response, return result
+        return _run_query(reg, params)
+
 
-        # Step 4: Return result
-        return QueryResult(success=True, data=response_data)
+def _run_query(reg: _QueryRegistration, params: dict[str, Any]) -> QueryResult:
+    """Map the projection's current state for params."""
+    return QueryResult(success=True, data=reg.mapper(reg.projection.state, params))
@@ -12,9 +12,11 @@ The aggregate's execute() method is a pure function:
 
 from __future__ import annotations
 
+import copy
+import sys
 from abc import ABC, abstractmethod
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, ClassVar, Generic, Iterable, Sequence, TypeVar
 from uuid import UUID, uuid4
 
 from clinical_core.domain.events import (
@@ -24,33 +26,51 @@ from clinical_core.domain.events import (
 )
 
 
+StateT = TypeVar("StateT")
+
+
 class DomainError(Exception):
     """Raised when an aggregate rejects a command due to an invariant violation."""
 
 
-class Aggregate(ABC):
-    """Base class for all aggregates.
+class Aggregate(ABC, Generic[StateT]):
+    """Base class for all aggregates, generic in their state type.
 
     Subclasses implement:
-    - aggregate_type: string name of the aggregate.
+    - aggregate_type: class attribute naming the aggregate.
     - initial_state(): the empty state before any events.
     - apply_event(state, event) -> new_state: the fold function.
     - execute(state, command) -> list[DomainEvent]: domain logic.
+
+    Subclasses may also list creator_commands (see below).
     """
 
-    @property
-    @abstractmethod
-    def aggregate_type(self) -> str:
-        """The aggregate type name (e.g., 'Encounter', 'Diagnosis')."""
-        ...
+    # The aggregate type name (e.g., 'Encounter', 'Diagnosis').
+    aggregate_type: ClassVar[str]
+
+    # Command types that only ever start a new stream. A handler may run
+    # them against initial_state() without reading the stream; if the
+    # stream already exists, the append conflicts and the handler decides
+    # again against the loaded state.
+    creator_commands: ClassVar[frozenset[type]] = frozenset()
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        if not hasattr(cls, "aggregate_type"):
+            raise TypeError(f"{cls.__name__} must define aggregate_type")
+        # A plain class attribute is interned once here, so every event
+        # built by the aggregate shares it.
+        aggregate_type = cls.__dict__.get("aggregate_type")
+        if type(aggregate_type) is str:
+            cls.aggregate_type = sys.intern(aggregate_type)
 
     @abstractmethod
-    def initial_state(self) -> dict[str, Any]:
+    def initial_state(self) -> StateT:
         """Return the initial state for a new aggregate (no events yet)."""
         ...
 
     @abstractmethod
-    def apply_event(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
+    def apply_event(self, state: StateT, event: DomainEvent) -> StateT:
         """Pure fold: apply one event to produce new state.
 
         Used during rehydration. Must be deterministic and side-effect-free.
@@ -58,7 +78,7 @@ class Aggregate(ABC):
         ...
 
     @abstractmethod
-    def execute(self, state: dict[str, Any], command: Any) -> list[DomainEvent]:
+    def execute(self, state: StateT, command: Any) -> list[DomainEvent]:
         """Execute domain logic: decide whether to accept the command.
 
         Returns a list of new events if the command is accepted.
@@ -68,11 +88,41 @@ class Aggregate(ABC):
         """
         ...
 
-    def rehydrate(self, events: list[DomainEvent]) -> dict[str, Any]:
-        """Rebuild aggregate state by replaying events through apply_event."""
+    def _apply_event_mut(self, state: StateT, event: DomainEvent) -> StateT:
+        """Fold step used by rehydration, which owns the state it folds.
+
+        May set top-level fields of state in place and return it (nested
+        containers must not be mutated). Defaults to apply_event; aggregates
+        override it to skip the per-event copy of a functional fold.
+        """
+        return self.apply_event(state, event)
+
+    def rehydrate(self, events: Iterable[DomainEvent]) -> StateT:
+        """Rebuild aggregate state by replaying events through _apply_event_mut.
+
+        events is consumed lazily, once, so a stream can be fed in chunks
+        (see EventStore.iter_stream) without holding all of it in memory.
+        """
         state = self.initial_state()
+        apply = self._apply_event_mut
+        for event in events:
+            state = apply(state, event)
+        return state
+
+    def rehydrate_from(
+        self, state: StateT, events: Sequence[DomainEvent],
+    ) -> StateT:
+        """Fold further events onto an already rehydrated state.
+
+        Used to bring a cached state up to date with the tail of its stream.
+        The given state is not modified.
+        """
+        if not events:
+            return state
+        state = copy.copy(state)
+        apply = self._apply_event_mut
         for event in events:
-            state = self.apply_event(state, event)
+            state = apply(state, event)
         return state
 
     def _build_event(
@@ -88,22 +138,24 @@ class Aggregate(ABC):
         (event_id, aggregate_version). The handler is responsible for
         assigning the final event_id and version before persistence.
         """
+        # Positional, in EventMetadata field order: this runs once per
+        # produced event, and skips matching fourteen keyword names.
         return DomainEvent(
-            metadata=EventMetadata(
-                event_id=uuid4(),
-                event_type=event_type,
-                schema_version=1,
-                aggregate_id=aggregate_id,
-                aggregate_type=self.aggregate_type,
-                aggregate_version=0,  # placeholder — handler sets real version
-                occurred_at=command.occurred_at,
-                performed_by=command.performed_by,
-                performer_role=command.performer_role,
-                organization_id=command.organization_id,
-                facility_id=command.facility_id,
-                device_id=command.device_id,
-                connection_status=command.connection_status,
-                correlation_id=command.correlation_id,
+            EventMetadata(
+                uuid4(),                    # event_id
+                sys.intern(event_type),     # event_type: interned, like table keys
+                1,                          # schema_version
+                aggregate_id,               # aggregate_id
+                self.aggregate_type,        # aggregate_type
+                0,                          # aggregate_version: placeholder, set by the handler
+                command.occurred_at,        # occurred_at
+                command.performed_by,       # performed_by
+                command.performer_role,     # performer_role
+                command.organization_id,    # organization_id
+                command.facility_id,        # facility_id
+                command.device_id,          # device_id
+                command.connection_status,  # connection_status
+                command.correlation_id,     # correlation_id
             ),
-            payload=payload,
+            payload,
         )
@@ -12,24 +12,39 @@ ConfirmDiagnosis flow:
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID, uuid4
 
 from clinical_core.domain.aggregate import Aggregate, DomainError
 from clinical_core.domain.events import (
+    DIAGNOSIS_CONFIRMED,
+    ENCOUNTER_BEGAN,
+    ENCOUNTER_COMPLETED,
+    ENCOUNTER_REOPENED,
+    PATIENT_CHECKED_IN,
+    PATIENT_DISCHARGED,
     ConnectionStatus,
     DomainEvent,
-    EventMetadata,
 )
 
 
+# Encounter status after each encounter event type that changes it.
+ENCOUNTER_STATUS_AFTER: dict[str, str] = {
+    PATIENT_CHECKED_IN: "checked_in",
+    ENCOUNTER_BEGAN: "active",
+    ENCOUNTER_REOPENED: "active",
+    ENCOUNTER_COMPLETED: "completed",
+    PATIENT_DISCHARGED: "completed",
+}
+
+
 # ---------------------------------------------------------------------------
 # Command
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ConfirmDiagnosis:
     """Command: intent to confirm a diagnosis for a patient during an encounter."""
     diagnosis_id: UUID
@@ -51,79 +66,100 @@ class ConfirmDiagnosis:
 # Aggregate
 # ---------------------------------------------------------------------------
 
-class DiagnosisAggregate(Aggregate):
+@dataclass(slots=True)
+class DiagnosisState:
+    """Rehydrated state of a single diagnosis.
+
+    IDs are kept as the strings carried in the DiagnosisConfirmed payload.
+    """
+    status: str = "unconfirmed"
+    condition: str | None = None
+    icd_code: str | None = None
+    patient_id: str | None = None
+    encounter_id: str | None = None
+
+
+class DiagnosisAggregate(Aggregate[DiagnosisState]):
     """Lifecycle aggregate for a single diagnosis.
 
     States: unconfirmed → confirmed
     """
 
-    @property
-    def aggregate_type(self) -> str:
-        return "Diagnosis"
-
-    def initial_state(self) -> dict[str, Any]:
-        return {
-            "status": "unconfirmed",
-            "condition": None,
-            "icd_code": None,
-            "patient_id": None,
-            "encounter_id": None,
-        }
-
-    def apply_event(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
-        if event.event_type == "clinical.judgment.DiagnosisConfirmed":
+    aggregate_type = "Diagnosis"
+
+    def initial_state(self) -> DiagnosisState:
+        return DiagnosisState()
+
+    def apply_event(self, state: DiagnosisState, event: DomainEvent) -> DiagnosisState:
+        if event.event_type == DIAGNOSIS_CONFIRMED:
+            return self._apply_event_mut(replace(state), event)
+        return state
+
+    def _apply_event_mut(self, state: DiagnosisState, event: DomainEvent) -> DiagnosisState:
+        if event.event_type == DIAGNOSIS_CONFIRMED:
             p = event.payload
-            return {
-                **state,
-                "status": "confirmed",
-                "condition": p.get("condition"),
-                "icd_code": p.get("icd_code"),
-                "patient_id": p.get("patient_id"),
-                "encounter_id": p.get("encounter_id"),
-            }
+            state.status = "confirmed"
+            state.condition = p.get("condition")
+            state.icd_code = p.get("icd_code")
+            state.patient_id = p.get("patient_id")
+            state.encounter_id = p.get("encounter_id")
         return state
 
-    def execute(self, state: dict[str, Any], command: Any) -> list[DomainEvent]:
-        if isinstance(command, ConfirmDiagnosis):
-            if state["status"] != "unconfirmed":
-                raise DomainError("Diagnosis already confirmed")
-            return [self._build_event(
-                command,
-                event_type="clinical.judgment.DiagnosisConfirmed",
-                aggregate_id=command.diagnosis_id,
-                payload={
-                    "diagnosis_id": str(command.diagnosis_id),
-                    "encounter_id": str(command.encounter_id),
-                    "patient_id": str(command.patient_id),
-                    "condition": command.condition,
-                    "icd_code": command.icd_code,
-                },
-            )]
-        raise DomainError(f"Unknown command: {type(command).__name__}")
+    def execute(self, state: DiagnosisState, command: Any) -> list[DomainEvent]:
+        execute = self._EXECUTE.get(type(command))
+        if execute is None:
+            raise DomainError(f"Unknown command: {type(command).__name__}")
+        return execute(self, state, command)
+
+    def _confirm(self, state: DiagnosisState, command: ConfirmDiagnosis) -> list[DomainEvent]:
+        if state.status != "unconfirmed":
+            raise DomainError("Diagnosis already confirmed")
+        return [self._build_event(
+            command,
+            event_type=DIAGNOSIS_CONFIRMED,
+            aggregate_id=command.diagnosis_id,
+            payload={
+                "diagnosis_id": str(command.diagnosis_id),
+                "encounter_id": str(command.encounter_id),
+                "patient_id": str(command.patient_id),
+                "condition": command.condition,
+                "icd_code": command.icd_code,
+            },
+        )]
+
+    # command type → decision step.
+    _EXECUTE: dict[type, Callable[..., list[DomainEvent]]] = {
+        ConfirmDiagnosis: _confirm,
+    }
 
 
 # ---------------------------------------------------------------------------
 # Specialized command handler with cross-aggregate encounter check
 # ---------------------------------------------------------------------------
 
+_DEFAULT_SNAPSHOT_EVERY = 100
+
+
 class DiagnosisCommandHandler:
     """Command handler for diagnosis commands.
 
     Extends the generic flow with a cross-aggregate precondition check:
     INV-CJ-1 — the referenced encounter must be in 'active' state.
 
-    The encounter state is derived by replaying the encounter's event stream.
+    The encounter state is derived from the encounter's event stream: its
+    latest status-changing event, found by scanning back from the end.
     This is an eventually consistent check (the encounter stream may be stale
     under offline operation).
-    """
 
-    _ENCOUNTER_ACTIVE_EVENTS = {
-        "clinical.encounter.EncounterBegan",
-    }
-    _ENCOUNTER_DEACTIVE_EVENTS = {
-        "clinical.encounter.EncounterCompleted",
-        "clinical.encounter.PatientDischarged",
-    }
+    If an encounter_status_view is given (any object with
+    status_of(encounter_id) -> str, e.g. EncounterStatusProjection), the
+    check is a single lookup in it instead of a replay. The view is only
+    as current as the events dispatched to it.
+
+    If a snapshot_store is given, the diagnosis is rehydrated from its latest
+    snapshot plus the events after it, and a new snapshot is saved each time
+    the stream passes a multiple of snapshot_every events.
+    """
 
     def __init__(
         self,
@@ -131,50 +167,86 @@ class DiagnosisCommandHandler:
         dispatcher: Any,
         aggregate: DiagnosisAggregate,
         encounter_store: Any,
+        snapshot_store: Any = None,
+        snapshot_every: int = _DEFAULT_SNAPSHOT_EVERY,
+        encounter_status_view: Any = None,
     ) -> None:
         self._event_store = event_store
         self._dispatcher = dispatcher
         self._aggregate = aggregate
         self._encounter_store = encounter_store
+        self._snapshot_store = snapshot_store
+        self._snapshot_every = snapshot_every
+        self._encounter_status_view = encounter_status_view
 
     def handle(self, command: ConfirmDiagnosis, aggregate_id: UUID) -> list[DomainEvent]:
         # Cross-aggregate check: encounter must be active (INV-CJ-1)
         self._check_encounter_active(command.encounter_id)
 
-        # Load diagnosis stream and rehydrate
-        stream = self._event_store.read_stream(aggregate_id)
-        state = self._aggregate.rehydrate(stream)
-        current_version = self._event_store.stream_version(aggregate_id)
+        # Load diagnosis stream (after the latest snapshot, if any) and rehydrate
+        state, current_version = self._load(aggregate_id)
 
         # Execute domain logic
         new_events = self._aggregate.execute(state, command)
 
-        # Persist with correct version
-        persisted: list[DomainEvent] = []
-        for i, event in enumerate(new_events):
-            versioned = _set_version(event, current_version + i + 1)
-            result = self._event_store.append(versioned)
-            persisted.append(result)
+        # Persist with correct versions, as one batch
+        versioned = [
+            _set_version(event, current_version + i)
+            for i, event in enumerate(new_events, start=1)
+        ]
+        persisted = self._event_store.append_many(
+            versioned, expected_version=current_version,
+        )
+
+        if self._snapshot_store is not None:
+            self._maybe_snapshot(aggregate_id, state, current_version, persisted)
 
-        # Dispatch
-        for event in persisted:
-            self._dispatcher.dispatch(event)
+        # Dispatch, as one batch
+        self._dispatcher.dispatch_batch(persisted)
 
         return persisted
 
+    def _load(self, aggregate_id: UUID) -> tuple[DiagnosisState, int]:
+        """Rehydrate the diagnosis and return (state, current_version)."""
+        snapshot = None
+        if self._snapshot_store is not None:
+            snapshot = self._snapshot_store.load(aggregate_id)
+        if snapshot is None:
+            stream = self._event_store.read_stream(aggregate_id)
+            state = self._aggregate.rehydrate(stream)
+            return state, stream[-1].aggregate_version if stream else 0
+
+        tail = self._event_store.read_stream_from(aggregate_id, snapshot.version + 1)
+        state = self._aggregate.rehydrate_from(snapshot.state, tail)
+        return state, tail[-1].aggregate_version if tail else snapshot.version
+
+    def _maybe_snapshot(
+        self,
+        aggregate_id: UUID,
+        state: DiagnosisState,
+        previous_version: int,
+        persisted: list[DomainEvent],
+    ) -> None:
+        """Save a snapshot if this append crossed a snapshot_every boundary."""
+        new_version = previous_version + len(persisted)
+        every = self._snapshot_every
+        if new_version // every > previous_version // every:
+            new_state = self._aggregate.rehydrate_from(state, persisted)
+            self._snapshot_store.save(aggregate_id, new_version, new_state)
+
     def _check_encounter_active(self, encounter_id: UUID) -> None:
-        """Derive encounter state from its event stream and verify it's active."""
-        enc_stream = self._encounter_store.read_stream(encounter_id)
-        enc_status = "none"
-        for event in enc_stream:
-            if event.event_type in self._ENCOUNTER_ACTIVE_EVENTS:
-                enc_status = "active"
-            elif event.event_type in self._ENCOUNTER_DEACTIVE_EVENTS:
-                enc_status = "completed"
-            elif event.event_type == "clinical.encounter.PatientCheckedIn":
-                enc_status = "checked_in"
-            elif event.event_type == "clinical.encounter.EncounterReopened":
-                enc_status = "active"
+        """Look up or derive the encounter's status and verify it's active."""
+        if self._encounter_status_view is not None:
+            enc_status = self._encounter_status_view.status_of(encounter_id)
+        else:
+            # The status is set by the latest status-changing event, so scan
+            # from the end and stop at the first one.
+            enc_status = "none"
+            for event in reversed(self._encounter_store.read_stream(encounter_id)):
+                status = ENCOUNTER_STATUS_AFTER.get(event.event_type)
+                if status is not None:
+                    enc_status = status
+                    break
         if enc_status != "active":
             raise DomainError(
                 f"Encounter {encounter_id} is not active (status: {enc_status}). "
@@ -184,24 +256,4 @@ class DiagnosisCommandHandler:
 
 def _set_version(event: DomainEvent, version: int) -> DomainEvent:
     """Return a new event with the correct aggregate_version."""
-    m = event.metadata
-    new_metadata = EventMetadata(
-        event_id=m.event_id,
-        event_type=m.event_type,
-        schema_version=m.schema_version,
-        aggregate_id=m.aggregate_id,
-        aggregate_type=m.aggregate_type,
-        aggregate_version=version,
-        occurred_at=m.occurred_at,
-        performed_by=m.performed_by,
-        performer_role=m.performer_role,
-        organization_id=m.organization_id,
-        facility_id=m.facility_id,
-        device_id=m.device_id,
-        connection_status=m.connection_status,
-        correlation_id=m.correlation_id,
-        recorded_at=m.recorded_at,
-        causation_id=m.causation_id,
-        visibility=m.visibility,
-    )
-    return DomainEvent(metadata=new_metadata, payload=event.payload)
+    return replace(event, metadata=replace(event.metadata, aggregate_version=version))
@@ -12,7 +12,7 @@ The event store persists and retrieves events — nothing more.
 
 from __future__ import annotations
 
-from typing import Protocol
+from typing import Iterator, Protocol, Sequence
 from uuid import UUID
 
 from clinical_core.domain.events import DomainEvent
@@ -28,13 +28,17 @@ class EventStore(Protocol):
     - No projection logic: the event store does not interpret events or update read models.
     """
 
-    def append(self, event: DomainEvent) -> DomainEvent:
+    def append(
+        self, event: DomainEvent, expected_version: int | None = None,
+    ) -> DomainEvent:
         """Append an event to its aggregate's stream.
 
         Pipeline Stage 2: Persist.
 
         Behavior:
         - Validates aggregate_version == current stream length + 1 (INV-XX-3).
+        - If expected_version is given, first checks that the stream is
+          still at that version (optimistic append).
         - If event_id already exists, returns the existing event (idempotent, no error).
         - Sets recorded_at to the current system time.
         - Returns the persisted event (with recorded_at populated).
@@ -44,40 +48,100 @@ class EventStore(Protocol):
         """
         ...
 
-    def read_stream(self, aggregate_id: UUID) -> list[DomainEvent]:
+    def append_many(
+        self, events: list[DomainEvent], expected_version: int | None = None,
+    ) -> list[DomainEvent]:
+        """Append several events in one call, all-or-nothing.
+
+        Same rules as append(), applied in order: versions must continue
+        each stream contiguously (events earlier in the batch count), and
+        duplicate event_ids return the existing event. All new events share
+        one recorded_at. If any event fails validation, none are stored.
+
+        expected_version is for single-stream batches: if given, the
+        stream of the first event must be at that version, checked once
+        before any per-event work. A batch that was already stored (a
+        retry) is returned as-is.
+
+        Returns the persisted events, in the order given.
+
+        Raises:
+            ConcurrencyError: if any aggregate_version does not match its
+                expected next version.
+        """
+        ...
+
+    def read_stream(self, aggregate_id: UUID) -> Sequence[DomainEvent]:
         """Read all events for an aggregate, ordered by aggregate_version.
 
         Used by:
         - Aggregate rehydration (loading current state from events).
         - Projection targeted rebuild (replaying one aggregate's history).
 
-        Returns an empty list if the aggregate has no events.
+        Returns an empty sequence if the aggregate has no events.
+
+        The returned sequence is read-only: implementations may return their
+        own storage rather than a copy, so callers must not mutate it.
+        """
+        ...
+
+    def iter_stream(
+        self, aggregate_id: UUID, chunk_size: int = 5000,
+    ) -> Iterator[DomainEvent]:
+        """Iterate an aggregate's events in version order, chunk by chunk.
+
+        Same events as read_stream, but fetched chunk_size at a time, so a
+        long stream can be replayed without materializing all of it.
+        Events appended after iteration starts are not included.
         """
         ...
 
-    def read_stream_from(self, aggregate_id: UUID, from_version: int) -> list[DomainEvent]:
+    def read_stream_from(
+        self, aggregate_id: UUID, from_version: int,
+    ) -> Sequence[DomainEvent]:
         """Read events for an aggregate starting from a given version (inclusive).
 
         Used by:
         - Incremental aggregate rehydration (loading events after a snapshot).
         - Catch-up processing.
 
-        Returns an empty list if no events exist at or after from_version.
+        Returns an empty sequence if no events exist at or after from_version.
         """
         ...
 
-    def read_all_events(self) -> list[DomainEvent]:
+    def read_all_events(
+        self, aggregate_types: set[str] | None = None,
+    ) -> list[DomainEvent]:
         """Read all events across all streams, ordered by recorded_at then event_id.
 
         Used by:
         - Full projection rebuild.
         - Catch-up polling (with filtering applied by the caller).
 
+        If aggregate_types is given, only events of those aggregate types
+        are returned, in the same relative order.
+
         This is a potentially expensive operation. Callers should prefer
         filtered reads when possible.
         """
         ...
 
+    def read_all_events_from(self, position: int) -> list[DomainEvent]:
+        """Read all events after the first `position` ones, in read_all_events order.
+
+        Used by catch-up readers that remember how many events they have
+        already seen (position == that count). New events only ever extend
+        the sequence, so a position stays valid as the store grows.
+        """
+        ...
+
+    def event_count(self) -> int:
+        """Return the total number of events across all streams.
+
+        Equal to len(read_all_events()), without materializing the events.
+        """
+        ...
+
     def stream_version(self, aggregate_id: UUID) -> int:
         """Return the current version (highest aggregate_version) of a stream.
 
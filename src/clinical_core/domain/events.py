@@ -8,17 +8,32 @@ This module defines:
 - DomainEvent: the immutable event envelope (metadata + payload).
 - ConcurrencyError: raised when aggregate version conflicts are detected.
 - EventValidationError: raised when event metadata is malformed.
+- Event type constants for the clinical event types the core consumes.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass, field
+import sys
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
 from enum import Enum
 from typing import Any
 from uuid import UUID
 
 
+# Event types, interned like those of built events (see
+# Aggregate._build_event), so table lookups keyed by them match by identity.
+PATIENT_CHECKED_IN = sys.intern("clinical.encounter.PatientCheckedIn")
+ENCOUNTER_BEGAN = sys.intern("clinical.encounter.EncounterBegan")
+ENCOUNTER_REOPENED = sys.intern("clinical.encounter.EncounterReopened")
+ENCOUNTER_COMPLETED = sys.intern("clinical.encounter.EncounterCompleted")
+PATIENT_DISCHARGED = sys.intern("clinical.encounter.PatientDischarged")
+VITAL_SIGNS_RECORDED = sys.intern("clinical.observation.VitalSignsRecorded")
+DIAGNOSIS_CONFIRMED = sys.intern("clinical.judgment.DiagnosisConfirmed")
+TREATMENT_STARTED = sys.intern("clinical.judgment.TreatmentStarted")
+TREATMENT_STOPPED = sys.intern("clinical.judgment.TreatmentStopped")
+
+
 class ConnectionStatus(Enum):
     ONLINE = "online"
     OFFLINE = "offline"
@@ -41,7 +56,7 @@ class ConcurrencyError(Exception):
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class EventMetadata:
     """Mandatory metadata for every clinical event.
 
@@ -83,7 +98,7 @@ class EventMetadata:
     visibility: tuple[str, ...] = ("clinical_staff",)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DomainEvent:
     """An immutable clinical event: metadata envelope + domain-specific payload.
 
@@ -125,23 +140,4 @@ class DomainEvent:
 
     def with_recorded_at(self, timestamp: datetime) -> DomainEvent:
         """Return a new event with recorded_at set. Used by event store at persist time."""
-        new_metadata = EventMetadata(
-            event_id=self.metadata.event_id,
-            event_type=self.metadata.event_type,
-            schema_version=self.metadata.schema_version,
-            aggregate_id=self.metadata.aggregate_id,
-            aggregate_type=self.metadata.aggregate_type,
-            aggregate_version=self.metadata.aggregate_version,
-            occurred_at=self.metadata.occurred_at,
-            performed_by=self.metadata.performed_by,
-            performer_role=self.metadata.performer_role,
-            organization_id=self.metadata.organization_id,
-            facility_id=self.metadata.facility_id,
-            device_id=self.metadata.device_id,
-            connection_status=self.metadata.connection_status,
-            correlation_id=self.metadata.correlation_id,
-            recorded_at=timestamp,
-            causation_id=self.metadata.causation_id,
-            visibility=self.metadata.visibility,
-        )
-        return DomainEvent(metadata=new_metadata, payload=self.payload)
+        return replace(self, metadata=replace(self.metadata, recorded_at=timestamp))
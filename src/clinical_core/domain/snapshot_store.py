@@ -0,0 +1,41 @@
+"""Snapshot Store port (interface).
+
+A snapshot records an aggregate's rehydrated state at a given stream
+version. Loading the latest snapshot and folding only the events after
+it bounds the cost of rehydrating a long stream.
+
+Snapshots are an optimization, never a source of truth: the event
+stream alone must always be enough to rebuild the state. A missing
+snapshot simply means a full replay.
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Any, Protocol
+from uuid import UUID
+
+
+@dataclass(frozen=True)
+class AggregateSnapshot:
+    """An aggregate's state as of its aggregate_version `version`."""
+    state: Any
+    version: int
+
+
+class SnapshotStore(Protocol):
+    """Port for aggregate snapshot persistence.
+
+    Implementations must satisfy:
+    - Latest wins: save() replaces any earlier snapshot for the aggregate.
+    - Isolation: a loaded state may be folded further by the caller without
+      altering what is stored.
+    """
+
+    def load(self, aggregate_id: UUID) -> AggregateSnapshot | None:
+        """Return the latest snapshot for an aggregate, or None if there is none."""
+        ...
+
+    def save(self, aggregate_id: UUID, version: int, state: Any) -> None:
+        """Store the aggregate's state as of `version`."""
+        ...
@@ -12,11 +12,17 @@ Rules enforced:
 - Sequential versioning: aggregate_version must be contiguous per stream.
 - Idempotent: duplicate event_id returns existing event without error.
 - No business logic, no domain interpretation of event payloads.
+- Thread-safe appends: one lock serializes the check-and-store of each batch.
+- Lock-free reads: each stream is a tuple, replaced whole on append, so a
+  read returns an immutable snapshot that later appends never change.
 """
 
 from __future__ import annotations
 
+import heapq
+import threading
 from datetime import datetime, timezone
+from typing import Iterator
 from uuid import UUID
 
 from clinical_core.domain.events import ConcurrencyError, DomainEvent
@@ -25,56 +31,140 @@ from clinical_core.domain.events import ConcurrencyError, DomainEvent
 class InMemoryEventStore:
     """In-memory implementation of the EventStore protocol.
 
-    Stores events in two structures:
-    - _streams: dict mapping aggregate_id → list of events (ordered by version).
+    Stores events in these structures:
+    - _streams: dict mapping aggregate_id → tuple of events (ordered by version).
     - _events_by_id: dict mapping event_id → event (for deduplication and lookup).
     - _all_events: list of all events in insertion order (for read_all_events).
+    - _stream_versions: dict mapping aggregate_id → current stream version.
+    - _positions_by_type: dict mapping aggregate_type → positions in _all_events.
     """
 
     def __init__(self) -> None:
-        self._streams: dict[UUID, list[DomainEvent]] = {}
+        self._streams: dict[UUID, tuple[DomainEvent, ...]] = {}
         self._events_by_id: dict[UUID, DomainEvent] = {}
         self._all_events: list[DomainEvent] = []
-
-    def append(self, event: DomainEvent) -> DomainEvent:
-        if event.event_id in self._events_by_id:
-            return self._events_by_id[event.event_id]
-
-        stream = self._streams.get(event.aggregate_id, [])
-        expected_version = len(stream) + 1
-
-        if event.aggregate_version != expected_version:
-            raise ConcurrencyError(
-                aggregate_id=event.aggregate_id,
-                expected_version=expected_version,
-                actual_version=event.aggregate_version,
-            )
-
-        persisted = event.with_recorded_at(datetime.now(timezone.utc))
-
-        if event.aggregate_id not in self._streams:
-            self._streams[event.aggregate_id] = []
-        self._streams[event.aggregate_id].append(persisted)
-        self._events_by_id[persisted.event_id] = persisted
-        self._all_events.append(persisted)
-
-        return persisted
-
-    def read_stream(self, aggregate_id: UUID) -> list[DomainEvent]:
-        return list(self._streams.get(aggregate_id, []))
-
-    def read_stream_from(self, aggregate_id: UUID, from_version: int) -> list[DomainEvent]:
-        stream = self._streams.get(aggregate_id, [])
-        return [e for e in stream if e.aggregate_version >= from_version]
-
-    def read_all_events(self) -> list[DomainEvent]:
-        return list(self._all_events)
+        self._stream_versions: dict[UUID, int] = {}
+        self._positions_by_type: dict[str, list[int]] = {}
+        self._write_lock = threading.Lock()
+
+    def append(
+        self, event: DomainEvent, expected_version: int | None = None,
+    ) -> DomainEvent:
+        return self.append_many([event], expected_version)[0]
+
+    def append_many(
+        self, events: list[DomainEvent], expected_version: int | None = None,
+    ) -> list[DomainEvent]:
+        with self._write_lock:
+            return self._append_many(events, expected_version)
+
+    def _append_many(
+        self, events: list[DomainEvent], expected_version: int | None,
+    ) -> list[DomainEvent]:
+        if expected_version is not None and events:
+            first = events[0]
+            actual_version = self._stream_versions.get(first.aggregate_id, 0)
+            if actual_version != expected_version and first.event_id not in self._events_by_id:
+                raise ConcurrencyError(
+                    aggregate_id=first.aggregate_id,
+                    expected_version=expected_version,
+                    actual_version=actual_version,
+                )
+
+        # Validate the whole batch before storing anything, so a version
+        # conflict on any event leaves the store untouched.
+        recorded_at = datetime.now(timezone.utc)
+        next_versions: dict[UUID, int] = {}
+        batch_by_id: dict[UUID, DomainEvent] = {}
+        to_store: list[DomainEvent] = []
+        result: list[DomainEvent] = []
+
+        for event in events:
+            existing = self._events_by_id.get(event.event_id) or batch_by_id.get(event.event_id)
+            if existing is not None:
+                result.append(existing)
+                continue
+
+            aggregate_id = event.aggregate_id
+            next_version = next_versions.get(aggregate_id)
+            if next_version is None:
+                next_version = self._stream_versions.get(aggregate_id, 0) + 1
+
+            if event.aggregate_version != next_version:
+                raise ConcurrencyError(
+                    aggregate_id=aggregate_id,
+                    expected_version=next_version,
+                    actual_version=event.aggregate_version,
+                )
+
+            next_versions[aggregate_id] = next_version + 1
+            persisted = event.with_recorded_at(recorded_at)
+            batch_by_id[persisted.event_id] = persisted
+            to_store.append(persisted)
+            result.append(persisted)
+
+        position = len(self._all_events)
+        added: dict[UUID, list[DomainEvent]] = {}
+        for persisted in to_store:
+            added.setdefault(persisted.aggregate_id, []).append(persisted)
+            self._positions_by_type.setdefault(persisted.aggregate_type, []).append(position)
+            position += 1
+        # Publish each stream's new tuple in one assignment.
+        streams = self._streams
+        for aggregate_id, new_events in added.items():
+            streams[aggregate_id] = streams.get(aggregate_id, ()) + tuple(new_events)
+        self._events_by_id.update(batch_by_id)
+        self._all_events.extend(to_store)
+        for aggregate_id, next_version in next_versions.items():
+            self._stream_versions[aggregate_id] = next_version - 1
+
+        return result
+
+    def read_stream(self, aggregate_id: UUID) -> tuple[DomainEvent, ...]:
+        # The stored tuple itself: immutable, so no copy and no lock needed.
+        return self._streams.get(aggregate_id, ())
+
+    def iter_stream(
+        self, aggregate_id: UUID, chunk_size: int = 5000,
+    ) -> Iterator[DomainEvent]:
+        stream = self._streams.get(aggregate_id, ())
+        end = len(stream)
+        for start in range(0, end, chunk_size):
+            yield from stream[start:min(start + chunk_size, end)]
+
+    def read_stream_from(
+        self, aggregate_id: UUID, from_version: int,
+    ) -> tuple[DomainEvent, ...]:
+        stream = self._streams.get(aggregate_id, ())
+        # Versions are contiguous from 1, so version v sits at index v - 1.
+        return stream[max(from_version, 1) - 1:]
+
+    def read_all_events(
+        self, aggregate_types: set[str] | None = None,
+    ) -> list[DomainEvent]:
+        if aggregate_types is None:
+            return list(self._all_events)
+        partitions = [
+            self._positions_by_type[t] for t in aggregate_types
+            if t in self._positions_by_type
+        ]
+        if len(partitions) == 1:
+            positions = partitions[0]
+        else:
+            # Merge the partitions back into global insertion order.
+            positions = heapq.merge(*partitions)
+        all_events = self._all_events
+        return [all_events[i] for i in positions]
+
+    def read_all_events_from(self, position: int) -> list[DomainEvent]:
+        return self._all_events[position:]
+
+    def event_count(self) -> int:
+        return len(self._all_events)
 
     def stream_version(self, aggregate_id: UUID) -> int:
-        stream = self._streams.get(aggregate_id, [])
-        if not stream:
-            return 0
-        return stream[-1].aggregate_version
+        return self._stream_versions.get(aggregate_id, 0)
 
     def event_exists(self, event_id: UUID) -> bool:
         return event_id in self._events_by_id
+
@@ -0,0 +1,35 @@
+"""In-memory Snapshot Store adapter.
+
+Implements the SnapshotStore protocol defined in domain/snapshot_store.py.
+Keeps the latest snapshot per aggregate in a dict.
+"""
+
+from __future__ import annotations
+
+import copy
+from typing import Any
+from uuid import UUID
+
+from clinical_core.domain.snapshot_store import AggregateSnapshot
+
+
+class InMemorySnapshotStore:
+    """In-memory implementation of the SnapshotStore protocol.
+
+    States are deep-copied on save and on load, so neither the saving
+    caller nor a loading caller can alter a stored snapshot.
+    """
+
+    def __init__(self) -> None:
+        self._snapshots: dict[UUID, AggregateSnapshot] = {}
+
+    def load(self, aggregate_id: UUID) -> AggregateSnapshot | None:
+        snapshot = self._snapshots.get(aggregate_id)
+        if snapshot is None:
+            return None
+        return AggregateSnapshot(state=copy.deepcopy(snapshot.state), version=snapshot.version)
+
+    def save(self, aggregate_id: UUID, version: int, state: Any) -> None:
+        self._snapshots[aggregate_id] = AggregateSnapshot(
+            state=copy.deepcopy(state), version=version,
+        )
@@ -4,8 +4,9 @@ No networking layer. Sync is performed via direct method calls between
 SyncNode instances, each wrapping an InMemoryEventStore and EventDispatcher.
 
 The engine implements the four sync operations:
-1. Exchange known event positions (event_count, known_event_ids).
-2. Detect missing events (set difference on event IDs).
+1. Exchange known event positions (event_count, known_event_ids, stream_roots).
+2. Detect missing events (set difference on event IDs, limited to streams
+   whose hash-chain roots differ).
 3. Transfer missing events (append to target store).
 4. Trigger projection updates (dispatch received events on target).
 
@@ -14,6 +15,7 @@ All operations are idempotent — syncing twice produces no duplicates.
 
 from __future__ import annotations
 
+import hashlib
 from dataclasses import dataclass
 from typing import Any
 from uuid import UUID
@@ -42,6 +44,14 @@ class SyncNode:
 
     Each node represents an independent device with its own local
     event store and projection dispatcher.
+
+    The node keeps its events and their IDs cached, and catches up with
+    only the events appended since its last read, however they were
+    appended (by sync or by local commands).
+
+    It also keeps a hash-chain root per stream: each event's ID is hashed
+    onto the previous root, in version order. Two nodes holding the same
+    events of a stream therefore hold the same root for it.
     """
 
     def __init__(
@@ -53,18 +63,38 @@ class SyncNode:
         self.node_id = node_id
         self.event_store = event_store
         self.dispatcher = dispatcher
+        self._events: list[DomainEvent] = []
+        self._known_ids: set[UUID] = set()
+        self._stream_roots: dict[UUID, bytes] = {}
+
+    def _catch_up(self) -> None:
+        """Fold events appended since the last read into the cache."""
+        new_events = self.event_store.read_all_events_from(len(self._events))
+        if new_events:
+            self._events.extend(new_events)
+            self._known_ids.update(e.event_id for e in new_events)
+            roots = self._stream_roots
+            for e in new_events:
+                roots[e.aggregate_id] = _chain(roots.get(e.aggregate_id, b""), e.event_id)
 
     def event_count(self) -> int:
         """Total number of events in this node's store."""
-        return len(self.event_store.read_all_events())
+        return self.event_store.event_count()
 
     def known_event_ids(self) -> set[UUID]:
         """Set of all event IDs this node has."""
-        return {e.event_id for e in self.event_store.read_all_events()}
+        self._catch_up()
+        return set(self._known_ids)
+
+    def stream_roots(self) -> dict[UUID, bytes]:
+        """Hash-chain root of each stream this node has, by aggregate_id."""
+        self._catch_up()
+        return dict(self._stream_roots)
 
     def all_events(self) -> list[DomainEvent]:
         """All events in insertion order."""
-        return self.event_store.read_all_events()
+        self._catch_up()
+        return list(self._events)
 
     def receive_event(self, event: DomainEvent) -> bool:
         """Receive an event from sync. Returns True if new, False if duplicate.
@@ -80,11 +110,16 @@ class SyncNode:
         return True
 
 
+def _chain(root: bytes, event_id: UUID) -> bytes:
+    """Extend a stream's hash-chain root with the next event ID."""
+    return hashlib.blake2b(root + event_id.bytes, digest_size=16).digest()
+
+
 class SyncEngine:
     """Orchestrates sync between two SyncNodes.
 
     No networking — direct method calls. The engine:
-    1. Compares known event IDs between source and target.
+    1. Compares stream roots, then known event IDs in diverged streams.
     2. Identifies events the target is missing.
     3. Transfers missing events to the target.
     4. Triggers projection dispatch on the target for new events.
@@ -92,8 +127,22 @@ class SyncEngine:
 
     def detect_missing(self, source: SyncNode, target: SyncNode) -> list[DomainEvent]:
         """Detect events that source has but target lacks."""
-        target_ids = target.known_event_ids()
-        return [e for e in source.all_events() if e.event_id not in target_ids]
+        source._catch_up()
+        target._catch_up()
+        # Streams with equal roots hold the same events on both nodes.
+        target_roots = target._stream_roots
+        diverged = {
+            aggregate_id
+            for aggregate_id, root in source._stream_roots.items()
+            if target_roots.get(aggregate_id) != root
+        }
+        if not diverged:
+            return []
+        target_ids = target._known_ids
+        return [
+            e for e in source._events
+            if e.aggregate_id in diverged and e.event_id not in target_ids
+        ]
 
     def sync(self, source: SyncNode, target: SyncNode) -> SyncResult:
         """One-directional sync: source → target.
@@ -101,8 +150,9 @@ class SyncEngine:
         Returns a SyncResult with counts of transferred and duplicate events.
         """
         missing = self.detect_missing(source, target)
+        # Everything source has that is not missing, target already had.
+        duplicates = len(source._known_ids) - len(missing)
         transferred = 0
-        duplicates = 0
 
         for event in missing:
             if target.receive_event(event):
@@ -110,13 +160,6 @@ class SyncEngine:
             else:
                 duplicates += 1
 
-        # Events already in target that were not in the missing list
-        # are also duplicates (detected during detect_missing).
-        source_ids = source.known_event_ids()
-        target_ids = target.known_event_ids()
-        already_had = source_ids & (target_ids - {e.event_id for e in missing})
-        duplicates += len(already_had)
-
         return SyncResult(
             transferred_count=transferred,
             duplicate_count=duplicates,
@@ -15,7 +15,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID, uuid4
 
 import pytest
@@ -28,7 +28,6 @@ from clinical_core.domain.events import (
 )
 from clinical_core.infrastructure.in_memory_event_store import InMemoryEventStore
 from clinical_core.application.command_handler import CommandHandler
-from clinical_core.application.event_dispatcher import EventDispatcher
 
 
 # ---------------------------------------------------------------------------
@@ -53,37 +52,59 @@ class EncounterAggregate(Aggregate):
         }
 
     def apply_event(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
-        p = event.payload
-        if event.event_type == "clinical.encounter.PatientCheckedIn":
-            return {
-                **state,
-                "status": "checked_in",
-                "patient_id": p.get("patient_id"),
-                "checked_in_at": p.get("checked_in_at"),
-            }
-        elif event.event_type == "clinical.encounter.EncounterBegan":
-            return {
-                **state,
-                "status": "active",
-                "practitioner_id": p.get("practitioner_id"),
-                "began_at": p.get("began_at"),
-            }
-        elif event.event_type == "clinical.encounter.EncounterCompleted":
-            return {
-                **state,
-                "status": "completed",
-                "completed_at": p.get("completed_at"),
-            }
+        return self._apply_event_mut(dict(state), event)
+
+    def _apply_event_mut(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
+        apply = self._APPLY.get(event.event_type)
+        if apply is not None:
+            apply(state, event.payload)
         return state
 
     def execute(self, state: dict[str, Any], command: Any) -> list[DomainEvent]:
         raise NotImplementedError("Not needed for rehydration tests")
 
+    @staticmethod
+    def _on_checked_in(state: dict[str, Any], p: dict[str, Any]) -> None:
+        state["status"] = "checked_in"
+        state["patient_id"] = p.get("patient_id")
+        state["checked_in_at"] = p.get("checked_in_at")
+
+    @staticmethod
+    def _on_began(state: dict[str, Any], p: dict[str, Any]) -> None:
+        state["status"] = "active"
+        state["practitioner_id"] = p.get("practitioner_id")
+        state["began_at"] = p.get("began_at")
+
+    @staticmethod
+    def _on_completed(state: dict[str, Any], p: dict[str, Any]) -> None:
+        state["status"] = "completed"
+        state["completed_at"] = p.get("completed_at")
+
+    # event_type → fold step.
+    _APPLY: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+        "clinical.encounter.PatientCheckedIn": _on_checked_in,
+        "clinical.encounter.EncounterBegan": _on_began,
+        "clinical.encounter.EncounterCompleted": _on_completed,
+    }
+
+
+# Aggregates are stateless (see TestNoPersistenceOfState), so one instance
+# serves every test.
+_AGG = EncounterAggregate()
+
 
 # ---------------------------------------------------------------------------
 # Helper: build events directly (no commands needed for rehydration tests)
 # ---------------------------------------------------------------------------
 
+# Metadata these tests never look at; built once instead of per event.
+_ORG_ID = uuid4()
+_FACILITY_ID = uuid4()
+_PERFORMED_BY = uuid4()
+_CORRELATION_ID = uuid4()
+_OCCURRED_AT = datetime.now(timezone.utc)
+
+
 def _event(
     event_type: str,
     aggregate_id: UUID,
@@ -98,14 +119,14 @@ def _event(
             aggregate_id=aggregate_id,
             aggregate_type="Encounter",
             aggregate_version=aggregate_version,
-            occurred_at=datetime.now(timezone.utc),
-            performed_by=uuid4(),
+            occurred_at=_OCCURRED_AT,
+            performed_by=_PERFORMED_BY,
             performer_role="physician",
-            organization_id=uuid4(),
-            facility_id=uuid4(),
+            organization_id=_ORG_ID,
+            facility_id=_FACILITY_ID,
             device_id="device-001",
             connection_status=ConnectionStatus.ONLINE,
-            correlation_id=uuid4(),
+            correlation_id=_CORRELATION_ID,
         ),
         payload=payload or {},
     )
@@ -115,7 +136,7 @@ def _encounter_stream(enc_id: UUID) -> list[DomainEvent]:
     """Build a standard 3-event encounter stream."""
     patient_id = str(uuid4())
     practitioner_id = str(uuid4())
-    now = datetime.now(timezone.utc).isoformat()
+    now = _OCCURRED_AT.isoformat()
     return [
         _event("clinical.encounter.PatientCheckedIn", enc_id, 1,
                {"patient_id": patient_id, "checked_in_at": now}),
@@ -126,6 +147,12 @@ def _encounter_stream(enc_id: UUID) -> list[DomainEvent]:
     ]
 
 
+@pytest.fixture(scope="module")
+def encounter_events() -> tuple[DomainEvent, ...]:
+    """One canonical encounter stream, shared by the tests that only read it."""
+    return tuple(_encounter_stream(uuid4()))
+
+
 # ---------------------------------------------------------------------------
 # Requirement 1: Deterministic reconstruction
 # ---------------------------------------------------------------------------
@@ -133,29 +160,46 @@ def _encounter_stream(enc_id: UUID) -> list[DomainEvent]:
 class TestDeterministicReconstruction:
     """Same events replayed → identical state, every time."""
 
-    def test_same_events_produce_same_state(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_same_events_produce_same_state(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         state_a = agg.rehydrate(events)
         state_b = agg.rehydrate(events)
 
         assert state_a == state_b
 
-    def test_replay_hundred_times_always_same(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_replay_hundred_times_always_same(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         first = agg.rehydrate(events)
         for _ in range(100):
             assert agg.rehydrate(events) == first
 
-    def test_partial_replay_is_deterministic(self) -> None:
-        agg = EncounterAggregate()
+    def test_snapshot_plus_tail_equals_full_replay(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
+        full = agg.rehydrate(events)
+
+        for split in range(len(events) + 1):
+            snapshot = agg.rehydrate(events[:split])
+            assert agg.rehydrate_from(snapshot, events[split:]) == full
+            assert snapshot == agg.rehydrate(events[:split])
+
+    def test_iter_stream_equivalent_to_list(self) -> None:
+        agg = _AGG
+        store = InMemoryEventStore()
         enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        store.append_many(_encounter_stream(enc_id))
+
+        chunked = store.iter_stream(enc_id, chunk_size=2)
+
+        assert agg.rehydrate(chunked) == agg.rehydrate(store.read_stream(enc_id))
+
+    def test_partial_replay_is_deterministic(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         # Replay only first 2 events
         state_a = agg.rehydrate(events[:2])
@@ -164,25 +208,23 @@ class TestDeterministicReconstruction:
         assert state_a["status"] == "active"
 
     def test_empty_stream_is_deterministic(self) -> None:
-        agg = EncounterAggregate()
+        agg = _AGG
         assert agg.rehydrate([]) == agg.rehydrate([])
         assert agg.rehydrate([]) == agg.initial_state()
 
-    def test_single_event_is_deterministic(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_single_event_is_deterministic(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         state_a = agg.rehydrate(events[:1])
         state_b = agg.rehydrate(events[:1])
         assert state_a == state_b
         assert state_a["status"] == "checked_in"
 
-    def test_state_depends_only_on_events_not_on_time(self) -> None:
+    def test_state_depends_only_on_events_not_on_time(self, encounter_events) -> None:
         """Rehydrating now vs. later (with same events) produces same state."""
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        agg = _AGG
+        events = encounter_events
 
         state_before = agg.rehydrate(events)
         # Simulate passage of time (events are the same objects)
@@ -198,11 +240,10 @@ class TestDeterministicReconstruction:
 class TestNoPersistenceOfState:
     """Aggregate state is transient — derived from events, never stored."""
 
-    def test_aggregate_has_no_stored_state(self) -> None:
+    def test_aggregate_has_no_stored_state(self, encounter_events) -> None:
         """The Aggregate object itself holds no state between calls."""
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        agg = EncounterAggregate()  # fresh, unlike _AGG
+        events = encounter_events
 
         agg.rehydrate(events)
 
@@ -210,12 +251,13 @@ class TestNoPersistenceOfState:
         assert not hasattr(agg, "_state")
         assert not hasattr(agg, "state")
         assert not hasattr(agg, "_current_state")
+        # Nor has the instance shared by the other tests picked any up
+        assert vars(_AGG) == {}
 
-    def test_rehydrate_returns_new_state_each_call(self) -> None:
+    def test_rehydrate_returns_new_state_each_call(self, encounter_events) -> None:
         """Each rehydrate call produces an independent state dict."""
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        agg = _AGG
+        events = encounter_events
 
         state_a = agg.rehydrate(events)
         state_b = agg.rehydrate(events)
@@ -223,10 +265,9 @@ class TestNoPersistenceOfState:
         assert state_a == state_b
         assert state_a is not state_b  # different objects
 
-    def test_modifying_returned_state_does_not_affect_aggregate(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_modifying_returned_state_does_not_affect_aggregate(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         state = agg.rehydrate(events)
         state["status"] = "TAMPERED"
@@ -235,30 +276,6 @@ class TestNoPersistenceOfState:
         fresh = agg.rehydrate(events)
         assert fresh["status"] == "completed"
 
-    def test_handler_does_not_cache_state(self) -> None:
-        """CommandHandler loads fresh state from event store every time."""
-        store = InMemoryEventStore()
-        dispatcher = EventDispatcher()
-        agg = EncounterAggregate()
-
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
-
-        # Manually persist events
-        for event in events:
-            store.append(event)
-
-        # Handler reads fresh from store each time
-        stream = store.read_stream(enc_id)
-        state = agg.rehydrate(stream)
-        assert state["status"] == "completed"
-
-        # Re-read produces same result (not cached)
-        stream2 = store.read_stream(enc_id)
-        state2 = agg.rehydrate(stream2)
-        assert state2["status"] == "completed"
-        assert state is not state2
-
 
 # ---------------------------------------------------------------------------
 # Requirement 3: Pure application of events
@@ -267,10 +284,9 @@ class TestNoPersistenceOfState:
 class TestPureEventApplication:
     """apply_event is a pure function: no side effects, no external reads."""
 
-    def test_apply_event_returns_new_dict(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_apply_event_returns_new_dict(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         state_before = agg.initial_state()
         state_after = agg.apply_event(state_before, events[0])
@@ -279,10 +295,9 @@ class TestPureEventApplication:
         assert state_before["status"] == "none"  # unchanged
         assert state_after["status"] == "checked_in"
 
-    def test_apply_event_does_not_mutate_input(self) -> None:
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+    def test_apply_event_does_not_mutate_input(self, encounter_events) -> None:
+        agg = _AGG
+        events = encounter_events
 
         original = agg.initial_state()
         original_copy = dict(original)
@@ -291,11 +306,10 @@ class TestPureEventApplication:
 
         assert original == original_copy  # input unchanged
 
-    def test_apply_event_same_input_same_output(self) -> None:
+    def test_apply_event_same_input_same_output(self, encounter_events) -> None:
         """Calling apply_event with identical inputs produces identical outputs."""
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        agg = _AGG
+        events = encounter_events
 
         state = agg.initial_state()
         result_a = agg.apply_event(state, events[0])
@@ -304,7 +318,7 @@ class TestPureEventApplication:
         assert result_a == result_b
 
     def test_unrecognized_event_returns_unchanged_state(self) -> None:
-        agg = EncounterAggregate()
+        agg = _AGG
         enc_id = uuid4()
         unknown = _event("clinical.unknown.SomethingHappened", enc_id, 1, {})
 
@@ -313,11 +327,10 @@ class TestPureEventApplication:
 
         assert result == state
 
-    def test_fold_is_sequential(self) -> None:
+    def test_fold_is_sequential(self, encounter_events) -> None:
         """State after N events == applying events one at a time."""
-        agg = EncounterAggregate()
-        enc_id = uuid4()
-        events = _encounter_stream(enc_id)
+        agg = _AGG
+        events = encounter_events
 
         # Method 1: rehydrate (batch)
         batch_state = agg.rehydrate(events)
@@ -328,3 +341,34 @@ class TestPureEventApplication:
             manual_state = agg.apply_event(manual_state, e)
 
         assert batch_state == manual_state
+
+    def test_events_carry_no_instance_dict(self, encounter_events) -> None:
+        """Events and their metadata are slotted: no per-instance __dict__."""
+        event = encounter_events[0]
+        assert not hasattr(event, "__dict__")
+        assert not hasattr(event.metadata, "__dict__")
+
+
+# ---------------------------------------------------------------------------
+# Aggregate declaration
+# ---------------------------------------------------------------------------
+
+class TestAggregateType:
+
+    def test_declared_as_class_attribute(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate
+
+        assert DiagnosisAggregate.aggregate_type == "Diagnosis"
+        assert DiagnosisAggregate().aggregate_type == "Diagnosis"
+
+    def test_subclass_without_aggregate_type_is_rejected(self) -> None:
+        with pytest.raises(TypeError, match="aggregate_type"):
+            class _Untyped(Aggregate):
+                def initial_state(self) -> dict[str, Any]:
+                    return {}
+
+                def apply_event(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
+                    return state
+
+                def execute(self, state: dict[str, Any], command: Any) -> list[DomainEvent]:
+                    return []
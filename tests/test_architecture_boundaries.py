@@ -22,6 +22,9 @@ These rules enforce:
 from __future__ import annotations
 
 import ast
+import functools
+import re
+from dataclasses import dataclass
 from pathlib import Path
 
 import pytest
@@ -57,49 +60,151 @@ _FORBIDDEN_IMPORTS: dict[str, list[str]] = {
 # Import scanner
 # ---------------------------------------------------------------------------
 
-def _extract_imports(filepath: Path) -> list[str]:
-    """Parse a Python file and return all imported module strings."""
-    source = filepath.read_text()
-    tree = ast.parse(source, filename=str(filepath))
-    imports: list[str] = []
-    for node in ast.walk(tree):
-        if isinstance(node, ast.Import):
-            for alias in node.names:
-                imports.append(alias.name)
-        elif isinstance(node, ast.ImportFrom):
-            if node.module:
-                imports.append(node.module)
-    return imports
-
-
-def _python_files(directory: Path) -> list[Path]:
-    """Recursively find all .py files, excluding __init__.py."""
-    return [
-        p for p in directory.rglob("*.py")
+# Any clinical_core.<layer> reference in the raw source. Only files that
+# mention a layer can import it, so the rest never need to be parsed.
+_LAYER_REFERENCE = re.compile(r"clinical_core\.(\w+)")
+
+_NESTED_BODIES = ("body", "handlers", "orelse", "finalbody", "cases")
+
+
+def _statements(body: list[ast.AST]):
+    """Yield every statement in a body, recursively, skipping expressions.
+
+    Imports and class definitions are statements, so there is no need to
+    visit expression nodes to find them. Nested bodies (functions, classes,
+    if/try/with/for/match blocks) are still entered: a function-local
+    import crosses a layer boundary just as a top-level one does.
+    """
+    stack = list(reversed(body))
+    while stack:
+        stmt = stack.pop()
+        yield stmt
+        nested: list[ast.AST] = []
+        for field in _NESTED_BODIES:
+            nested.extend(getattr(stmt, field, ()))
+        stack.extend(reversed(nested))
+
+
+@dataclass(frozen=True)
+class _Findings:
+    """Imports, class bases and open() calls found in one source file."""
+    imports: tuple[str, ...]
+    class_bases: tuple[tuple[str, str], ...]  # (class name, base name)
+    calls_open: bool
+
+
+@dataclass(frozen=True)
+class _ModuleInfo:
+    """One source file. Parsed lazily, and at most once."""
+    path: Path
+    layer: str
+    source: str
+
+    @functools.cached_property
+    def referenced_layers(self) -> frozenset[str]:
+        """Layers named as clinical_core.<layer> anywhere in the source."""
+        return frozenset(_LAYER_REFERENCE.findall(self.source))
+
+    @functools.cached_property
+    def findings(self) -> _Findings:
+        """Everything the pattern checks look for, from one traversal."""
+        tree = ast.parse(self.source, filename=str(self.path))
+        # open() calls are expressions, so only a file that mentions open
+        # needs the full walk; otherwise statements are enough.
+        look_for_open = "open" in self.source
+        nodes = ast.walk(tree) if look_for_open else _statements(tree.body)
+
+        imports: list[str] = []
+        class_bases: list[tuple[str, str]] = []
+        calls_open = False
+        for node in nodes:
+            if isinstance(node, ast.Import):
+                for alias in node.names:
+                    imports.append(alias.name)
+            elif isinstance(node, ast.ImportFrom):
+                if node.module:
+                    imports.append(node.module)
+            elif isinstance(node, ast.ClassDef):
+                for base in node.bases:
+                    if isinstance(base, ast.Name):
+                        class_bases.append((node.name, base.id))
+                    elif isinstance(base, ast.Attribute):
+                        class_bases.append((node.name, base.attr))
+            elif look_for_open and isinstance(node, ast.Call):
+                func = node.func
+                if isinstance(func, ast.Name) and func.id == "open":
+                    calls_open = True
+        return _Findings(tuple(imports), tuple(class_bases), calls_open)
+
+    @property
+    def imports(self) -> tuple[str, ...]:
+        return self.findings.imports
+
+    @property
+    def class_bases(self) -> tuple[tuple[str, str], ...]:
+        """(class name, base name) for every class defined in the file."""
+        return self.findings.class_bases
+
+    @property
+    def calls_open(self) -> bool:
+        """Whether the module calls the open() builtin anywhere."""
+        return self.findings.calls_open
+
+
+def _scan_file(filepath: Path) -> _ModuleInfo:
+    """Read a Python file; parsing is left until a test needs the tree."""
+    return _ModuleInfo(
+        path=filepath,
+        layer=filepath.relative_to(_SRC_ROOT).parts[0],
+        source=filepath.read_text(),
+    )
+
+
+def _scan_codebase() -> tuple[_ModuleInfo, ...]:
+    """Scan every .py file under clinical_core, excluding __init__.py."""
+    return tuple(
+        _scan_file(p) for p in sorted(_SRC_ROOT.rglob("*.py"))
         if p.name != "__init__.py"
-    ]
+    )
+
+
+@pytest.fixture(scope="module")
+def manifest() -> tuple[_ModuleInfo, ...]:
+    """The scanned codebase, built once and shared by every test here."""
+    return _scan_codebase()
+
 
+def _in_layer(manifest: tuple[_ModuleInfo, ...], layer_name: str) -> list[_ModuleInfo]:
+    return [m for m in manifest if m.layer == layer_name]
 
-def _clinical_core_imports(imports: list[str]) -> list[str]:
+
+def _clinical_core_imports(imports: tuple[str, ...]) -> list[str]:
     """Filter to only clinical_core.* imports."""
     return [i for i in imports if i.startswith("clinical_core.")]
 
 
+# (prefix, layer) for every clinical_core layer package.
+_LAYER_PREFIXES: tuple[tuple[str, str], ...] = tuple(
+    (f"clinical_core.{layer}.", layer) for layer in _LAYERS
+)
+
+
 def _layer_of_import(module_path: str) -> str | None:
     """Determine which layer a clinical_core import belongs to.
 
     Returns 'domain', 'application', 'infrastructure', 'sync', or None.
     """
-    parts = module_path.split(".")
-    if len(parts) < 2:
-        return None
     # clinical_core.domain.events → 'domain'
     # clinical_core.application.event_dispatcher → 'application'
-    return parts[1]
+    for prefix, layer in _LAYER_PREFIXES:
+        # The bare package too: `from clinical_core.domain import events`.
+        if module_path.startswith(prefix) or module_path == prefix[:-1]:
+            return layer
+    return None
 
 
-def _find_violations(layer_name: str, directory: Path) -> list[str]:
-    """Scan all files in a layer directory for forbidden imports.
+def _find_violations(manifest: tuple[_ModuleInfo, ...], layer_name: str) -> list[str]:
+    """Check all files of a layer for forbidden imports.
 
     Returns a list of violation descriptions.
     """
@@ -108,13 +213,13 @@ def _find_violations(layer_name: str, directory: Path) -> list[str]:
         return []
 
     violations: list[str] = []
-    for py_file in _python_files(directory):
-        imports = _extract_imports(py_file)
-        cc_imports = _clinical_core_imports(imports)
-        for imp in cc_imports:
+    for module in _in_layer(manifest, layer_name):
+        if module.referenced_layers.isdisjoint(forbidden):
+            continue
+        for imp in _clinical_core_imports(module.imports):
             target_layer = _layer_of_import(imp)
             if target_layer in forbidden:
-                rel_path = py_file.relative_to(_SRC_ROOT)
+                rel_path = module.path.relative_to(_SRC_ROOT)
                 violations.append(
                     f"{rel_path} imports {imp} "
                     f"({layer_name} → {target_layer} is forbidden)"
@@ -129,8 +234,8 @@ def _find_violations(layer_name: str, directory: Path) -> list[str]:
 class TestDomainBoundary:
     """Domain layer must not import from application, infrastructure, or sync."""
 
-    def test_no_forbidden_imports(self) -> None:
-        violations = _find_violations("domain", _DOMAIN_DIR)
+    def test_no_forbidden_imports(self, manifest) -> None:
+        violations = _find_violations(manifest, "domain")
         assert violations == [], (
             f"Domain layer boundary violations:\n" +
             "\n".join(f"  - {v}" for v in violations)
@@ -140,8 +245,8 @@ class TestDomainBoundary:
 class TestApplicationBoundary:
     """Application layer must not import from infrastructure or sync."""
 
-    def test_no_forbidden_imports(self) -> None:
-        violations = _find_violations("application", _APPLICATION_DIR)
+    def test_no_forbidden_imports(self, manifest) -> None:
+        violations = _find_violations(manifest, "application")
         assert violations == [], (
             f"Application layer boundary violations:\n" +
             "\n".join(f"  - {v}" for v in violations)
@@ -151,8 +256,8 @@ class TestApplicationBoundary:
 class TestInfrastructureBoundary:
     """Infrastructure layer must not import from application or sync."""
 
-    def test_no_forbidden_imports(self) -> None:
-        violations = _find_violations("infrastructure", _INFRASTRUCTURE_DIR)
+    def test_no_forbidden_imports(self, manifest) -> None:
+        violations = _find_violations(manifest, "infrastructure")
         assert violations == [], (
             f"Infrastructure layer boundary violations:\n" +
             "\n".join(f"  - {v}" for v in violations)
@@ -162,8 +267,8 @@ class TestInfrastructureBoundary:
 class TestSyncBoundary:
     """Sync layer must not import from application or infrastructure."""
 
-    def test_no_forbidden_imports(self) -> None:
-        violations = _find_violations("sync", _SYNC_DIR)
+    def test_no_forbidden_imports(self, manifest) -> None:
+        violations = _find_violations(manifest, "sync")
         assert violations == [], (
             f"Sync layer boundary violations:\n" +
             "\n".join(f"  - {v}" for v in violations)
@@ -177,11 +282,10 @@ class TestSyncBoundary:
 class TestAllBoundaries:
     """Scan every layer and report all violations in one test."""
 
-    def test_no_violations_across_entire_codebase(self) -> None:
+    def test_no_violations_across_entire_codebase(self, manifest) -> None:
         all_violations: list[str] = []
-        for layer_name, directory in _LAYERS.items():
-            if directory.exists():
-                all_violations.extend(_find_violations(layer_name, directory))
+        for layer_name in _LAYERS:
+            all_violations.extend(_find_violations(manifest, layer_name))
 
         assert all_violations == [], (
             f"Architecture boundary violations ({len(all_violations)}):\n" +
@@ -196,55 +300,41 @@ class TestAllBoundaries:
 class TestForbiddenPatterns:
     """Detect specific anti-patterns that violate Clean Architecture."""
 
-    def test_domain_has_no_framework_imports(self) -> None:
+    def test_domain_has_no_framework_imports(self, manifest) -> None:
         """Domain must not import web frameworks, ORMs, or HTTP libraries."""
         framework_keywords = [
             "flask", "django", "fastapi", "starlette", "sqlalchemy",
             "requests", "httpx", "aiohttp", "uvicorn",
         ]
-        for py_file in _python_files(_DOMAIN_DIR):
-            imports = _extract_imports(py_file)
-            for imp in imports:
+        mentions_framework = re.compile("|".join(framework_keywords), re.IGNORECASE)
+        for module in _in_layer(manifest, "domain"):
+            if not mentions_framework.search(module.source):
+                continue
+            for imp in module.imports:
                 imp_lower = imp.lower()
                 for kw in framework_keywords:
                     assert kw not in imp_lower, (
-                        f"domain/{py_file.name} imports framework library: {imp}"
+                        f"domain/{module.path.name} imports framework library: {imp}"
                     )
 
-    def test_domain_has_no_io_operations(self) -> None:
+    def test_domain_has_no_io_operations(self, manifest) -> None:
         """Domain modules must not perform file I/O, network, or DB access."""
-        io_keywords = ["open(", "requests.", "http", "socket", "sqlite", "psycopg"]
-        for py_file in _python_files(_DOMAIN_DIR):
-            source = py_file.read_text()
-            for kw in io_keywords:
-                # Allow in docstrings/comments by checking if it appears in code
-                tree = ast.parse(source)
-                for node in ast.walk(tree):
-                    if isinstance(node, ast.Call):
-                        func = node.func
-                        if isinstance(func, ast.Name) and func.id == "open":
-                            rel_path = py_file.relative_to(_SRC_ROOT)
-                            pytest.fail(
-                                f"domain/{rel_path} contains open() call (I/O in domain)"
-                            )
-
-    def test_infrastructure_does_not_define_domain_classes(self) -> None:
+        # Checked on the AST, so mentions in docstrings/comments are allowed
+        for module in _in_layer(manifest, "domain"):
+            if module.calls_open:
+                rel_path = module.path.relative_to(_SRC_ROOT)
+                pytest.fail(
+                    f"domain/{rel_path} contains open() call (I/O in domain)"
+                )
+
+    def test_infrastructure_does_not_define_domain_classes(self, manifest) -> None:
         """Infrastructure must not define Aggregate or DomainEvent subclasses."""
-        for py_file in _python_files(_INFRASTRUCTURE_DIR):
-            source = py_file.read_text()
-            tree = ast.parse(source)
-            for node in ast.walk(tree):
-                if isinstance(node, ast.ClassDef):
-                    for base in node.bases:
-                        base_name = ""
-                        if isinstance(base, ast.Name):
-                            base_name = base.id
-                        elif isinstance(base, ast.Attribute):
-                            base_name = base.attr
-                        assert base_name not in ("Aggregate", "DomainEvent"), (
-                            f"infrastructure/{py_file.name} defines class {node.name} "
-                            f"inheriting from {base_name} (domain class in infrastructure)"
-                        )
+        for module in _in_layer(manifest, "infrastructure"):
+            for class_name, base_name in module.class_bases:
+                assert base_name not in ("Aggregate", "DomainEvent"), (
+                    f"infrastructure/{module.path.name} defines class {class_name} "
+                    f"inheriting from {base_name} (domain class in infrastructure)"
+                )
 
 
 # ---------------------------------------------------------------------------
@@ -254,49 +344,49 @@ class TestForbiddenPatterns:
 class TestDependencyDirection:
     """Verify that dependencies flow inward: outer → inner, never reverse."""
 
-    def test_domain_depends_on_nothing_external(self) -> None:
+    def test_domain_depends_on_nothing_external(self, manifest) -> None:
         """Domain has zero clinical_core imports outside domain."""
-        for py_file in _python_files(_DOMAIN_DIR):
-            imports = _extract_imports(py_file)
-            cc_imports = _clinical_core_imports(imports)
-            for imp in cc_imports:
+        for module in _in_layer(manifest, "domain"):
+            if module.referenced_layers <= {"domain"}:
+                continue
+            for imp in _clinical_core_imports(module.imports):
                 layer = _layer_of_import(imp)
                 assert layer == "domain", (
-                    f"domain/{py_file.name} imports from {layer}: {imp}"
+                    f"domain/{module.path.name} imports from {layer}: {imp}"
                 )
 
-    def test_application_depends_only_on_domain(self) -> None:
+    def test_application_depends_only_on_domain(self, manifest) -> None:
         """Application may only import from domain (not infrastructure or sync)."""
-        for py_file in _python_files(_APPLICATION_DIR):
-            imports = _extract_imports(py_file)
-            cc_imports = _clinical_core_imports(imports)
-            for imp in cc_imports:
+        for module in _in_layer(manifest, "application"):
+            if module.referenced_layers <= {"domain", "application"}:
+                continue
+            for imp in _clinical_core_imports(module.imports):
                 layer = _layer_of_import(imp)
                 assert layer in ("domain", "application"), (
-                    f"application/{py_file.relative_to(_APPLICATION_DIR)} "
+                    f"application/{module.path.relative_to(_APPLICATION_DIR)} "
                     f"imports from {layer}: {imp}"
                 )
 
-    def test_infrastructure_depends_only_on_domain(self) -> None:
+    def test_infrastructure_depends_only_on_domain(self, manifest) -> None:
         """Infrastructure may only import from domain."""
-        for py_file in _python_files(_INFRASTRUCTURE_DIR):
-            imports = _extract_imports(py_file)
-            cc_imports = _clinical_core_imports(imports)
-            for imp in cc_imports:
+        for module in _in_layer(manifest, "infrastructure"):
+            if module.referenced_layers <= {"domain"}:
+                continue
+            for imp in _clinical_core_imports(module.imports):
                 layer = _layer_of_import(imp)
                 assert layer == "domain", (
-                    f"infrastructure/{py_file.name} imports from {layer}: {imp}"
+                    f"infrastructure/{module.path.name} imports from {layer}: {imp}"
                 )
 
-    def test_sync_depends_only_on_domain(self) -> None:
+    def test_sync_depends_only_on_domain(self, manifest) -> None:
         """Sync may only import from domain."""
-        for py_file in _python_files(_SYNC_DIR):
-            imports = _extract_imports(py_file)
-            cc_imports = _clinical_core_imports(imports)
-            for imp in cc_imports:
+        for module in _in_layer(manifest, "sync"):
+            if module.referenced_layers <= {"domain"}:
+                continue
+            for imp in _clinical_core_imports(module.imports):
                 layer = _layer_of_import(imp)
                 assert layer == "domain", (
-                    f"sync/{py_file.name} imports from {layer}: {imp}"
+                    f"sync/{module.path.name} imports from {layer}: {imp}"
                 )
 
 
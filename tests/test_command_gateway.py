@@ -15,6 +15,9 @@ No framework coupling — requests are plain dicts.
 
 from __future__ import annotations
 
+import json
+import sys
+from dataclasses import dataclass
 from datetime import datetime, timezone
 from typing import Any
 from uuid import UUID, uuid4
@@ -65,14 +68,16 @@ def _encounter_event(
 
 
 def _setup_active_encounter(store: InMemoryEventStore, enc_id: UUID) -> None:
-    store.append(_encounter_event(
-        enc_id, "clinical.encounter.PatientCheckedIn", 1,
-        {"patient_id": str(uuid4())},
-    ))
-    store.append(_encounter_event(
-        enc_id, "clinical.encounter.EncounterBegan", 2,
-        {"practitioner_id": str(uuid4())},
-    ))
+    store.append_many([
+        _encounter_event(
+            enc_id, "clinical.encounter.PatientCheckedIn", 1,
+            {"patient_id": str(uuid4())},
+        ),
+        _encounter_event(
+            enc_id, "clinical.encounter.EncounterBegan", 2,
+            {"practitioner_id": str(uuid4())},
+        ),
+    ])
 
 
 def _valid_confirm_diagnosis_request(
@@ -159,6 +164,13 @@ class TestReceiveRequest:
         assert result.success is False
         assert "payload" in result.error.lower()
 
+    def test_rejects_null_payload(self) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle({"command_type": "ConfirmDiagnosis", "payload": None})
+
+        assert result.success is False
+        assert result.error == "Missing required field: payload"
+
     def test_rejects_unknown_command_type(self) -> None:
         from clinical_core.application.gateway import CommandGateway
 
@@ -171,6 +183,61 @@ class TestReceiveRequest:
         assert result.success is False
         assert "unknown" in result.error.lower()
 
+    def test_rejects_unhashable_command_type_as_unknown(self) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle({"command_type": ["ConfirmDiagnosis"], "payload": {}})
+
+        assert result.success is False
+        assert result.error == "Unknown command type: ['ConfirmDiagnosis']"
+
+    @pytest.mark.parametrize("payload", [["encounter_id"], "encounter_id"])
+    def test_rejects_payload_that_is_not_an_object(self, payload) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle({"command_type": "ConfirmDiagnosis", "payload": payload})
+
+        assert result.success is False
+        assert result.error.startswith("Missing required field in payload: ")
+
+    def test_accepts_json_request_body(self) -> None:
+        gateway, store, _ = _build_gateway()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        body = json.dumps(_valid_confirm_diagnosis_request(enc_id)).encode()
+        result = gateway.handle_bytes(body)
+
+        assert result.success is True
+        assert result.events[0].event_type == "clinical.judgment.DiagnosisConfirmed"
+
+    def test_rejects_malformed_json_body(self) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle_bytes(b'{"command_type": ')
+
+        assert result.success is False
+        assert "malformed json" in result.error.lower()
+
+    def test_rejects_json_body_that_is_not_an_object(self) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle_bytes(b'["ConfirmDiagnosis"]')
+
+        assert result.success is False
+        assert result.error == "Request must be a JSON object"
+
+    @pytest.mark.parametrize("body", [None, 5])
+    def test_rejects_body_that_is_not_bytes_or_str(self, body) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle_bytes(body)
+
+        assert result.success is False
+        assert "malformed json" in result.error.lower()
+
+    def test_rejects_too_deeply_nested_json_body(self) -> None:
+        gateway, _, _ = _build_gateway()
+        result = gateway.handle_bytes(b"[" * 100_000 + b"]" * 100_000)
+
+        assert result.success is False
+        assert "malformed json" in result.error.lower()
+
 
 # ---------------------------------------------------------------------------
 # Tests: Validate input shape
@@ -203,6 +270,89 @@ class TestValidateInputShape:
 
         assert result.success is False
 
+    def test_invalid_uuid_error_names_the_field(self) -> None:
+        gateway, store, _ = _build_gateway()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        request = _valid_confirm_diagnosis_request(enc_id)
+        request["payload"]["patient_id"] = "not-a-uuid"
+
+        result = gateway.handle(request)
+
+        assert result.success is False
+        assert result.error == "Invalid UUID for field: patient_id"
+        assert store.stream_version(enc_id) == 2
+
+    def test_accepts_uuid_instances(self) -> None:
+        gateway, store, _ = _build_gateway()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        request = _valid_confirm_diagnosis_request(enc_id)
+        request["payload"]["diagnosis_id"] = uuid4()
+
+        result = gateway.handle(request)
+
+        assert result.success is True
+
+    def test_custom_required_fields_are_enforced(self) -> None:
+        from clinical_core.application.gateway import CommandGateway
+
+        gateway = CommandGateway()
+        gateway.register(
+            "ConfirmDiagnosis",
+            handler=None,
+            aggregate_id_field="diagnosis_id",
+            required_fields=["diagnosis_id", "reviewer"],
+        )
+
+        result = gateway.handle({
+            "command_type": "ConfirmDiagnosis",
+            "payload": {"diagnosis_id": str(uuid4())},
+        })
+
+        assert result.success is False
+        assert result.error == "Missing required field in payload: reviewer"
+
+    def test_register_requires_aggregate_id_to_be_a_uuid_field(self) -> None:
+        from clinical_core.application.gateway import CommandGateway
+
+        gateway = CommandGateway()
+        with pytest.raises(ValueError, match="uuid_fields"):
+            gateway.register(
+                "ConfirmDiagnosis",
+                handler=None,
+                aggregate_id_field="diagnosis_id",
+                uuid_fields=["encounter_id"],
+            )
+
+    def test_register_rejects_command_type_without_command_class(self) -> None:
+        from clinical_core.application.gateway import CommandGateway
+
+        gateway = CommandGateway()
+        with pytest.raises(ValueError, match="RetireDiagnosis"):
+            gateway.register(
+                "RetireDiagnosis",
+                handler=None,
+                aggregate_id_field="diagnosis_id",
+                uuid_fields=["diagnosis_id"],
+            )
+
+    def test_parsers_fall_back_to_annotation_names(self) -> None:
+        """A forward reference that cannot be resolved yet does not break registration."""
+        from clinical_core.application.gateway import _build_parsers, _datetime, _uuid
+
+        @dataclass(frozen=True)
+        class ReviewDiagnosis:
+            diagnosis_id: UUID
+            occurred_at: datetime
+            reviewer: Reviewer  # noqa: F821 — defined nowhere
+
+        parsers = dict(_build_parsers(ReviewDiagnosis, ["diagnosis_id"]))
+
+        assert parsers == {"diagnosis_id": _uuid, "occurred_at": _datetime, "reviewer": None}
+
 
 # ---------------------------------------------------------------------------
 # Tests: Map request → command
@@ -240,6 +390,19 @@ class TestMapRequestToCommand:
         assert payload["icd_code"] == "E11"
         assert payload["diagnosis_id"] == str(diag_id)
 
+    def test_context_strings_are_interned(self) -> None:
+        gateway, store, _ = _build_gateway()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        request = _valid_confirm_diagnosis_request(enc_id)
+        request["payload"]["performer_role"] = "".join(["phys", "ician"])
+        request["payload"]["device_id"] = "".join(["device-", "001"])
+        metadata = gateway.handle(request).events[0].metadata
+
+        assert metadata.performer_role is sys.intern("physician")
+        assert metadata.device_id is sys.intern("device-001")
+
 
 # ---------------------------------------------------------------------------
 # Tests: Send command to handler and return result
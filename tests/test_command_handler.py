@@ -16,9 +16,10 @@ Uses a test aggregate (SimpleEncounter) with a minimal state machine:
 
 from __future__ import annotations
 
+import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
-from typing import Any
+from typing import Any, Callable
 from uuid import UUID, uuid4
 
 import pytest
@@ -36,7 +37,7 @@ from clinical_core.infrastructure.in_memory_event_store import InMemoryEventStor
 # Test domain: SimpleEncounter aggregate + commands
 # ---------------------------------------------------------------------------
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StartEncounter:
     """Command: intent to start an encounter."""
     encounter_id: UUID
@@ -52,7 +53,7 @@ class StartEncounter:
     correlation_id: UUID
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class CompleteEncounter:
     """Command: intent to complete an active encounter."""
     encounter_id: UUID
@@ -76,44 +77,70 @@ class SimpleEncounter(Aggregate):
     def aggregate_type(self) -> str:
         return "Encounter"
 
+    creator_commands = frozenset({StartEncounter})
+
     def initial_state(self) -> dict[str, Any]:
         return {"status": "none", "patient_id": None, "practitioner_id": None}
 
     def apply_event(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
-        if event.event_type == "test.encounter.Started":
-            return {
-                **state,
-                "status": "started",
-                "patient_id": event.payload.get("patient_id"),
-                "practitioner_id": event.payload.get("practitioner_id"),
-            }
-        elif event.event_type == "test.encounter.Completed":
-            return {**state, "status": "completed"}
+        return self._apply_event_mut(dict(state), event)
+
+    def _apply_event_mut(self, state: dict[str, Any], event: DomainEvent) -> dict[str, Any]:
+        apply = self._APPLY.get(event.event_type)
+        if apply is not None:
+            apply(state, event.payload)
         return state
 
+    @staticmethod
+    def _on_started(state: dict[str, Any], p: dict[str, Any]) -> None:
+        state["status"] = "started"
+        state["patient_id"] = p.get("patient_id")
+        state["practitioner_id"] = p.get("practitioner_id")
+
+    @staticmethod
+    def _on_completed(state: dict[str, Any], p: dict[str, Any]) -> None:
+        state["status"] = "completed"
+
+    # event_type → fold step.
+    _APPLY: dict[str, Callable[[dict[str, Any], dict[str, Any]], None]] = {
+        "test.encounter.Started": _on_started,
+        "test.encounter.Completed": _on_completed,
+    }
+
     def execute(self, state: dict[str, Any], command: Any) -> list[DomainEvent]:
-        if isinstance(command, StartEncounter):
-            if state["status"] != "none":
-                raise DomainError("Encounter already started")
-            return [self._build_event(
-                command,
-                event_type="test.encounter.Started",
-                aggregate_id=command.encounter_id,
-                payload={
-                    "patient_id": str(command.patient_id),
-                    "practitioner_id": str(command.practitioner_id),
-                },
-            )]
-        elif isinstance(command, CompleteEncounter):
-            if state["status"] != "started":
-                raise DomainError("Encounter must be started before completing")
-            return [self._build_event(
-                command,
-                event_type="test.encounter.Completed",
-                aggregate_id=command.encounter_id,
-                payload={},
-            )]
-        raise DomainError(f"Unknown command: {type(command).__name__}")
+        execute = self._EXECUTE.get(type(command))
+        if execute is None:
+            raise DomainError(f"Unknown command: {type(command).__name__}")
+        return execute(self, state, command)
+
+    def _start(self, state: dict[str, Any], command: StartEncounter) -> list[DomainEvent]:
+        if state["status"] != "none":
+            raise DomainError("Encounter already started")
+        return [self._build_event(
+            command,
+            event_type="test.encounter.Started",
+            aggregate_id=command.encounter_id,
+            payload={
+                "patient_id": str(command.patient_id),
+                "practitioner_id": str(command.practitioner_id),
+            },
+        )]
+
+    def _complete(self, state: dict[str, Any], command: CompleteEncounter) -> list[DomainEvent]:
+        if state["status"] != "started":
+            raise DomainError("Encounter must be started before completing")
+        return [self._build_event(
+            command,
+            event_type="test.encounter.Completed",
+            aggregate_id=command.encounter_id,
+            payload={},
+        )]
+
+    # command type → decision step.
+    _EXECUTE: dict[type, Callable[..., list[DomainEvent]]] = {
+        StartEncounter: _start,
+        CompleteEncounter: _complete,
+    }
 
 
 # ---------------------------------------------------------------------------
@@ -201,6 +228,16 @@ class TestAggregateRehydration:
         final_state = agg.rehydrate(all_events)
         assert final_state["status"] == "completed"
 
+    def test_apply_event_leaves_given_state_untouched(self) -> None:
+        agg = SimpleEncounter()
+        initial = agg.initial_state()
+        events = agg.execute(initial, _make_start_command())
+
+        state = agg.apply_event(initial, events[0])
+
+        assert state["status"] == "started"
+        assert initial == agg.initial_state()
+
 
 # ---------------------------------------------------------------------------
 # Tests: Aggregate domain logic
@@ -250,6 +287,19 @@ class TestAggregateDomainLogic:
         with pytest.raises(DomainError, match="must be started"):
             agg.execute(final_state, _make_complete_command(encounter_id=enc_id))
 
+    def test_unknown_command_raises(self) -> None:
+        agg = SimpleEncounter()
+        with pytest.raises(DomainError, match="Unknown command: object"):
+            agg.execute(agg.initial_state(), object())
+
+    def test_built_event_type_is_interned(self) -> None:
+        agg = SimpleEncounter()
+        built = "".join(["test.encounter.", "Started"])
+
+        event = agg._build_event(_make_start_command(), built, uuid4(), {})
+
+        assert event.event_type is sys.intern("test.encounter.Started")
+
 
 # ---------------------------------------------------------------------------
 # Tests: CommandHandler full flow
@@ -405,3 +455,133 @@ class TestCommandHandlerFlow:
         r2 = handler.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
 
         assert r1[0].event_id != r2[0].event_id
+
+
+# ---------------------------------------------------------------------------
+# Tests: Rehydration cache
+# ---------------------------------------------------------------------------
+
+class _CountingStore(InMemoryEventStore):
+    """In-memory store that counts full-stream reads."""
+
+    def __init__(self) -> None:
+        super().__init__()
+        self.full_reads = 0
+
+    def read_stream(self, aggregate_id: UUID) -> list[DomainEvent]:
+        self.full_reads += 1
+        return super().read_stream(aggregate_id)
+
+
+@pytest.fixture
+def new_handler():
+    """Build a CommandHandler for SimpleEncounter over the given store."""
+    from clinical_core.application.command_handler import CommandHandler
+    from clinical_core.application.event_dispatcher import EventDispatcher
+
+    def new(store: InMemoryEventStore, **kwargs: Any) -> CommandHandler:
+        return CommandHandler(
+            event_store=store, dispatcher=EventDispatcher(), aggregate=SimpleEncounter(), **kwargs,
+        )
+    return new
+
+
+class TestRehydrationCache:
+
+    def test_cached_aggregate_is_not_replayed_in_full(self, new_handler) -> None:
+        store = _CountingStore()
+        handler = new_handler(store)
+
+        enc_id = uuid4()
+        handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+        handler.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        # The start is a creator command and the complete hits the cache.
+        assert store.full_reads == 0
+        assert store.stream_version(enc_id) == 2
+
+    def test_cache_picks_up_events_appended_elsewhere(self, new_handler) -> None:
+        """Two handlers sharing a store: each sees the other's writes."""
+        store = InMemoryEventStore()
+        handler_a = new_handler(store)
+        handler_b = new_handler(store)
+
+        enc_id = uuid4()
+        with pytest.raises(DomainError):
+            handler_a.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
+        handler_b.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        result = handler_a.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        assert result[0].aggregate_version == 2
+
+    def test_least_recently_used_aggregate_is_evicted(self, new_handler) -> None:
+        store = _CountingStore()
+        handler = new_handler(store, cache_size=1)
+
+        first, second = uuid4(), uuid4()
+        handler.handle(_make_start_command(encounter_id=first), aggregate_id=first)
+        handler.handle(_make_start_command(encounter_id=second), aggregate_id=second)
+        handler.handle(_make_complete_command(encounter_id=first), aggregate_id=first)
+
+        # Only the evicted aggregate is read back.
+        assert store.full_reads == 1
+        assert store.stream_version(first) == 2
+
+    def test_concurrency_error_evicts_cached_state(self, new_handler) -> None:
+        class _ConflictingStore(_CountingStore):
+            conflict = False
+
+            def append_many(self, events, expected_version=None):
+                if self.conflict:
+                    raise ConcurrencyError(events[0].aggregate_id, 2, 1)
+                return super().append_many(events, expected_version)
+
+        store = _ConflictingStore()
+        handler = new_handler(store)
+
+        enc_id = uuid4()
+        handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+        store.conflict = True
+        with pytest.raises(ConcurrencyError):
+            handler.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
+        store.conflict = False
+        handler.handle(_make_complete_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        assert store.full_reads == 1
+
+
+# ---------------------------------------------------------------------------
+# Tests: Creator commands
+# ---------------------------------------------------------------------------
+
+class TestCreatorCommands:
+
+    def test_creator_command_skips_reading_the_stream(self, new_handler) -> None:
+        store = _CountingStore()
+        handler = new_handler(store)
+
+        enc_id = uuid4()
+        result = handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        assert store.full_reads == 0
+        assert result[0].aggregate_version == 1
+
+    def test_creator_command_on_existing_stream_is_a_domain_error(self, new_handler) -> None:
+        store = InMemoryEventStore()
+        enc_id = uuid4()
+        new_handler(store).handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        handler = new_handler(store)
+        with pytest.raises(DomainError, match="already started"):
+            handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+
+        assert store.stream_version(enc_id) == 1
+
+    def test_creator_command_on_cached_aggregate_is_a_domain_error(self, new_handler) -> None:
+        handler = new_handler(InMemoryEventStore())
+
+        enc_id = uuid4()
+        handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
+        with pytest.raises(DomainError, match="already started"):
+            handler.handle(_make_start_command(encounter_id=enc_id), aggregate_id=enc_id)
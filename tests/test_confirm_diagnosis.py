@@ -40,6 +40,11 @@ from clinical_core.application.event_dispatcher import EventDispatcher
 _ORG_ID = uuid4()
 _FACILITY_ID = uuid4()
 
+# Setup-event metadata these tests never look at; built once, not per event.
+_PERFORMED_BY = uuid4()
+_CORRELATION_ID = uuid4()
+_OCCURRED_AT = datetime.now(timezone.utc)
+
 
 def _event(
     event_type: str,
@@ -55,14 +60,14 @@ def _event(
             aggregate_id=aggregate_id,
             aggregate_type="Encounter",
             aggregate_version=aggregate_version,
-            occurred_at=datetime.now(timezone.utc),
-            performed_by=uuid4(),
+            occurred_at=_OCCURRED_AT,
+            performed_by=_PERFORMED_BY,
             performer_role="physician",
             organization_id=_ORG_ID,
             facility_id=_FACILITY_ID,
             device_id="device-001",
             connection_status=ConnectionStatus.ONLINE,
-            correlation_id=uuid4(),
+            correlation_id=_CORRELATION_ID,
         ),
         payload=payload or {},
     )
@@ -97,14 +102,16 @@ def _confirm_diagnosis_cmd(
 def _setup_active_encounter(store: InMemoryEventStore, enc_id: UUID) -> None:
     """Persist encounter events so the encounter is in 'active' state."""
     patient_id = str(uuid4())
-    store.append(_event(
-        "clinical.encounter.PatientCheckedIn", enc_id, 1,
-        {"patient_id": patient_id},
-    ))
-    store.append(_event(
-        "clinical.encounter.EncounterBegan", enc_id, 2,
-        {"practitioner_id": str(uuid4())},
-    ))
+    store.append_many([
+        _event(
+            "clinical.encounter.PatientCheckedIn", enc_id, 1,
+            {"patient_id": patient_id},
+        ),
+        _event(
+            "clinical.encounter.EncounterBegan", enc_id, 2,
+            {"practitioner_id": str(uuid4())},
+        ),
+    ])
 
 
 class SpyHandler:
@@ -126,7 +133,17 @@ class TestDiagnosisAggregateRehydration:
 
         agg = DiagnosisAggregate()
         state = agg.initial_state()
-        assert state["status"] == "unconfirmed"
+        assert state.status == "unconfirmed"
+
+    def test_state_is_a_slotted_dataclass(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate, DiagnosisState
+
+        state = DiagnosisAggregate().initial_state()
+        assert isinstance(state, DiagnosisState)
+        assert not hasattr(state, "__dict__")
+
+    def test_command_is_slotted(self) -> None:
+        assert not hasattr(_confirm_diagnosis_cmd(), "__dict__")
 
     def test_rehydrate_from_confirmed_event(self) -> None:
         from clinical_core.domain.diagnosis import DiagnosisAggregate
@@ -159,9 +176,33 @@ class TestDiagnosisAggregateRehydration:
             },
         )
         state = agg.rehydrate([event])
-        assert state["status"] == "confirmed"
-        assert state["condition"] == "Hypertension"
-        assert state["icd_code"] == "I10"
+        assert state.status == "confirmed"
+        assert state.condition == "Hypertension"
+        assert state.icd_code == "I10"
+
+    def test_folding_does_not_mutate_caller_state(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate
+
+        agg = DiagnosisAggregate()
+        diag_id = uuid4()
+        event = _event(
+            "clinical.judgment.DiagnosisConfirmed", diag_id, 1,
+            {
+                "diagnosis_id": str(diag_id),
+                "encounter_id": str(uuid4()),
+                "patient_id": str(uuid4()),
+                "condition": "Hypertension",
+                "icd_code": "I10",
+            },
+        )
+        start = agg.initial_state()
+
+        applied = agg.apply_event(start, event)
+        folded = agg.rehydrate_from(start, [event])
+
+        assert start == agg.initial_state()
+        assert applied.status == "confirmed"
+        assert folded.status == "confirmed"
 
 
 # ---------------------------------------------------------------------------
@@ -200,6 +241,22 @@ class TestDiagnosisInvariants:
         assert payload["patient_id"] == str(patient_id)
         assert payload["encounter_id"] == str(encounter_id)
 
+    def test_confirm_event_carries_command_context(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate
+
+        agg = DiagnosisAggregate()
+        cmd = _confirm_diagnosis_cmd()
+        metadata = agg.execute(agg.initial_state(), cmd)[0].metadata
+
+        assert metadata.aggregate_id == cmd.diagnosis_id
+        assert metadata.aggregate_type == "Diagnosis"
+        assert metadata.schema_version == 1
+        for name in (
+            "occurred_at", "performed_by", "performer_role", "organization_id",
+            "facility_id", "device_id", "connection_status", "correlation_id",
+        ):
+            assert getattr(metadata, name) == getattr(cmd, name), name
+
     def test_cannot_confirm_already_confirmed_diagnosis(self) -> None:
         """INV: A diagnosis aggregate can only be confirmed once."""
         from clinical_core.domain.diagnosis import DiagnosisAggregate
@@ -213,6 +270,25 @@ class TestDiagnosisInvariants:
         with pytest.raises(DomainError, match="already confirmed"):
             agg.execute(confirmed_state, _confirm_diagnosis_cmd(diagnosis_id=diag_id))
 
+    def test_event_ids_are_distinct_version_4_uuids(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate
+
+        agg = DiagnosisAggregate()
+        ids = [
+            agg.execute(agg.initial_state(), _confirm_diagnosis_cmd())[0].event_id
+            for _ in range(600)
+        ]
+
+        assert len(set(ids)) == len(ids)
+        assert all(event_id.version == 4 for event_id in ids)
+
+    def test_unknown_command_is_rejected(self) -> None:
+        from clinical_core.domain.diagnosis import DiagnosisAggregate
+
+        agg = DiagnosisAggregate()
+        with pytest.raises(DomainError, match="Unknown command: object"):
+            agg.execute(agg.initial_state(), object())
+
     def test_aggregate_type_is_diagnosis(self) -> None:
         from clinical_core.domain.diagnosis import DiagnosisAggregate
 
@@ -249,23 +325,29 @@ class TestEncounterInvariant:
         assert len(result) == 1
         assert result[0].event_type == "clinical.judgment.DiagnosisConfirmed"
 
-    def test_confirm_rejected_when_encounter_not_started(self) -> None:
-        """Encounter exists but is only checked-in, not active."""
+    @pytest.mark.parametrize(
+        ("event_types", "status"),
+        [
+            ((), "none"),
+            (("PatientCheckedIn",), "checked_in"),
+            (("PatientCheckedIn", "EncounterBegan", "EncounterCompleted"), "completed"),
+        ],
+        ids=["does_not_exist", "not_started", "completed"],
+    )
+    def test_confirm_rejected_when_encounter_not_active(self, event_types, status) -> None:
         from clinical_core.domain.diagnosis import DiagnosisAggregate, DiagnosisCommandHandler
 
         store = InMemoryEventStore()
-        dispatcher = EventDispatcher()
         enc_id = uuid4()
-
-        # Only check in, don't begin the encounter
-        store.append(_event(
-            "clinical.encounter.PatientCheckedIn", enc_id, 1,
-            {"patient_id": str(uuid4())},
-        ))
+        if event_types:
+            store.append_many([
+                _event(f"clinical.encounter.{event_type}", enc_id, version)
+                for version, event_type in enumerate(event_types, start=1)
+            ])
 
         handler = DiagnosisCommandHandler(
             event_store=store,
-            dispatcher=dispatcher,
+            dispatcher=EventDispatcher(),
             aggregate=DiagnosisAggregate(),
             encounter_store=store,
         )
@@ -273,25 +355,22 @@ class TestEncounterInvariant:
         diag_id = uuid4()
         cmd = _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id)
 
-        with pytest.raises(DomainError, match="[Ee]ncounter.*not active"):
+        with pytest.raises(DomainError, match=rf"[Ee]ncounter.*not active \(status: {status}\)"):
             handler.handle(cmd, aggregate_id=diag_id)
+        assert store.stream_version(diag_id) == 0
 
-    def test_confirm_rejected_when_encounter_completed(self) -> None:
+    def test_confirm_succeeds_when_encounter_reopened(self) -> None:
         from clinical_core.domain.diagnosis import DiagnosisAggregate, DiagnosisCommandHandler
 
         store = InMemoryEventStore()
-        dispatcher = EventDispatcher()
         enc_id = uuid4()
-
         _setup_active_encounter(store, enc_id)
-        store.append(_event(
-            "clinical.encounter.EncounterCompleted", enc_id, 3,
-            {"completed_at": datetime.now(timezone.utc).isoformat()},
-        ))
+        store.append(_event("clinical.encounter.EncounterCompleted", enc_id, 3, {}))
+        store.append(_event("clinical.encounter.EncounterReopened", enc_id, 4, {}))
 
         handler = DiagnosisCommandHandler(
             event_store=store,
-            dispatcher=dispatcher,
+            dispatcher=EventDispatcher(),
             aggregate=DiagnosisAggregate(),
             encounter_store=store,
         )
@@ -299,27 +378,27 @@ class TestEncounterInvariant:
         diag_id = uuid4()
         cmd = _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id)
 
-        with pytest.raises(DomainError, match="[Ee]ncounter.*not active"):
-            handler.handle(cmd, aggregate_id=diag_id)
+        assert len(handler.handle(cmd, aggregate_id=diag_id)) == 1
 
-    def test_confirm_rejected_when_encounter_does_not_exist(self) -> None:
+    def test_status_ignores_later_events_that_do_not_change_it(self) -> None:
         from clinical_core.domain.diagnosis import DiagnosisAggregate, DiagnosisCommandHandler
 
         store = InMemoryEventStore()
-        dispatcher = EventDispatcher()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+        store.append(_event("clinical.encounter.VitalsRecorded", enc_id, 3, {}))
 
         handler = DiagnosisCommandHandler(
             event_store=store,
-            dispatcher=dispatcher,
+            dispatcher=EventDispatcher(),
             aggregate=DiagnosisAggregate(),
             encounter_store=store,
         )
 
         diag_id = uuid4()
-        cmd = _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=uuid4())
+        cmd = _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id)
 
-        with pytest.raises(DomainError, match="[Ee]ncounter.*not active"):
-            handler.handle(cmd, aggregate_id=diag_id)
+        assert len(handler.handle(cmd, aggregate_id=diag_id)) == 1
 
 
 # ---------------------------------------------------------------------------
@@ -414,6 +493,102 @@ class TestFullRoundTrip:
         stream = store.read_stream(diag_id)
         state = agg.rehydrate(stream)
 
-        assert state["status"] == "confirmed"
-        assert state["condition"] == "Asthma"
-        assert state["icd_code"] == "J45"
+        assert state.status == "confirmed"
+        assert state.condition == "Asthma"
+        assert state.icd_code == "J45"
+
+
+# ---------------------------------------------------------------------------
+# Tests: Snapshots
+# ---------------------------------------------------------------------------
+
+class TestSnapshots:
+
+    def _handler(self, store, snapshot_store, snapshot_every=1):
+        from clinical_core.domain.diagnosis import DiagnosisAggregate, DiagnosisCommandHandler
+
+        return DiagnosisCommandHandler(
+            event_store=store,
+            dispatcher=EventDispatcher(),
+            aggregate=DiagnosisAggregate(),
+            encounter_store=store,
+            snapshot_store=snapshot_store,
+            snapshot_every=snapshot_every,
+        )
+
+    def test_snapshot_saved_at_interval(self) -> None:
+        from clinical_core.infrastructure.in_memory_snapshot_store import InMemorySnapshotStore
+
+        store = InMemoryEventStore()
+        snapshots = InMemorySnapshotStore()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        diag_id = uuid4()
+        self._handler(store, snapshots).handle(
+            _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id),
+            aggregate_id=diag_id,
+        )
+
+        snapshot = snapshots.load(diag_id)
+        assert snapshot is not None
+        assert snapshot.version == 1
+        assert snapshot.state.status == "confirmed"
+
+    def test_no_snapshot_before_interval(self) -> None:
+        from clinical_core.infrastructure.in_memory_snapshot_store import InMemorySnapshotStore
+
+        store = InMemoryEventStore()
+        snapshots = InMemorySnapshotStore()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        diag_id = uuid4()
+        self._handler(store, snapshots, snapshot_every=2).handle(
+            _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id),
+            aggregate_id=diag_id,
+        )
+
+        assert snapshots.load(diag_id) is None
+
+    def test_rehydrates_from_snapshot_without_full_read(self) -> None:
+        from clinical_core.infrastructure.in_memory_snapshot_store import InMemorySnapshotStore
+
+        class _NoFullReads(InMemoryEventStore):
+            def read_stream(self, aggregate_id):
+                if aggregate_id == self.guarded:
+                    raise AssertionError("full stream read")
+                return super().read_stream(aggregate_id)
+
+        store = _NoFullReads()
+        store.guarded = None
+        snapshots = InMemorySnapshotStore()
+        enc_id = uuid4()
+        _setup_active_encounter(store, enc_id)
+
+        diag_id = uuid4()
+        handler = self._handler(store, snapshots)
+        handler.handle(
+            _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id),
+            aggregate_id=diag_id,
+        )
+        store.guarded = diag_id
+
+        with pytest.raises(DomainError, match="already confirmed"):
+            handler.handle(
+                _confirm_diagnosis_cmd(diagnosis_id=diag_id, encounter_id=enc_id),
+                aggregate_id=diag_id,
+            )
+
+    def test_snapshot_store_isolates_loaded_state(self) -> None:
+        from clinical_core.infrastructure.in_memory_snapshot_store import InMemorySnapshotStore
+
+        snapshots = InMemorySnapshotStore()
+        agg_id = uuid4()
+        state = {"status": "confirmed"}
+        snapshots.save(agg_id, 1, state)
+
+        state["status"] = "tampered"
+        snapshots.load(agg_id).state["status"] = "tampered"
+
+        assert snapshots.load(agg_id).state == {"status": "confirmed"}
@@ -0,0 +1,151 @@
+"""Tests for the Encounter Status Projection.
+
+Consumes the encounter lifecycle events and produces a status per
+encounter, used by DiagnosisCommandHandler for the INV-CJ-1 check
+without replaying the encounter stream.
+"""
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+from uuid import UUID, uuid4
+
+import pytest
+
+from clinical_core.application.event_dispatcher import EventDispatcher
+from clinical_core.application.projections.encounter_status import EncounterStatusProjection
+from clinical_core.domain.aggregate import DomainError
+from clinical_core.domain.events import (
+    ConnectionStatus,
+    DomainEvent,
+    EventMetadata,
+)
+from clinical_core.infrastructure.in_memory_event_store import InMemoryEventStore
+
+
+# ---------------------------------------------------------------------------
+# Test helpers
+# ---------------------------------------------------------------------------
+
+def _encounter_event(event_type: str, encounter_id: UUID, version: int) -> DomainEvent:
+    return DomainEvent(
+        metadata=EventMetadata(
+            event_id=uuid4(),
+            event_type=f"clinical.encounter.{event_type}",
+            schema_version=1,
+            aggregate_id=encounter_id,
+            aggregate_type="Encounter",
+            aggregate_version=version,
+            occurred_at=datetime.now(timezone.utc),
+            performed_by=uuid4(),
+            performer_role="physician",
+            organization_id=uuid4(),
+            facility_id=uuid4(),
+            device_id="device-001",
+            connection_status=ConnectionStatus.ONLINE,
+            correlation_id=uuid4(),
+        ),
+    )
+
+
+def _lifecycle(encounter_id: UUID, *event_types: str) -> list[DomainEvent]:
+    return [
+        _encounter_event(event_type, encounter_id, version)
+        for version, event_type in enumerate(event_types, start=1)
+    ]
+
+
+# ---------------------------------------------------------------------------
+# Tests: Status folding
+# ---------------------------------------------------------------------------
+
+class TestEncounterStatus:
+
+    def test_unknown_encounter_is_none(self) -> None:
+        assert EncounterStatusProjection().status_of(uuid4()) == "none"
+
+    @pytest.mark.parametrize(
+        ("event_types", "expected"),
+        [
+            (("PatientCheckedIn",), "checked_in"),
+            (("PatientCheckedIn", "EncounterBegan"), "active"),
+            (("PatientCheckedIn", "EncounterBegan", "EncounterCompleted"), "completed"),
+            (("PatientCheckedIn", "EncounterBegan", "PatientDischarged"), "completed"),
+            (("EncounterBegan", "EncounterCompleted", "EncounterReopened"), "active"),
+        ],
+    )
+    def test_status_follows_lifecycle(self, event_types, expected) -> None:
+        enc_id = uuid4()
+        proj = EncounterStatusProjection()
+        proj.rebuild_from(_lifecycle(enc_id, *event_types))
+
+        assert proj.status_of(enc_id) == expected
+
+    def test_encounters_tracked_independently(self) -> None:
+        enc_a, enc_b = uuid4(), uuid4()
+        proj = EncounterStatusProjection()
+        proj.rebuild_from(
+            _lifecycle(enc_a, "EncounterBegan")
+            + _lifecycle(enc_b, "EncounterBegan", "EncounterCompleted")
+        )
+
+        assert proj.status_of(enc_a) == "active"
+        assert proj.status_of(enc_b) == "completed"
+
+
+# ---------------------------------------------------------------------------
+# Tests: Used by DiagnosisCommandHandler
+# ---------------------------------------------------------------------------
+
+class TestDiagnosisHandlerUsesView:
+
+    def test_handler_checks_status_without_reading_encounter_stream(self) -> None:
+        from clinical_core.domain.diagnosis import (
+            ConfirmDiagnosis,
+            DiagnosisAggregate,
+            DiagnosisCommandHandler,
+        )
+
+        class _NoEncounterReads(InMemoryEventStore):
+            def read_stream(self, aggregate_id):
+                raise AssertionError("encounter stream read")
+
+        dispatcher = EventDispatcher()
+        view = EncounterStatusProjection()
+        dispatcher.subscribe_all(view.subscribed_event_types, view.handle)
+
+        enc_id = uuid4()
+        dispatcher.dispatch_batch(_lifecycle(enc_id, "PatientCheckedIn", "EncounterBegan"))
+
+        handler = DiagnosisCommandHandler(
+            event_store=InMemoryEventStore(),
+            dispatcher=dispatcher,
+            aggregate=DiagnosisAggregate(),
+            encounter_store=_NoEncounterReads(),
+            encounter_status_view=view,
+        )
+
+        def command(diag_id: UUID) -> ConfirmDiagnosis:
+            return ConfirmDiagnosis(
+                diagnosis_id=diag_id,
+                encounter_id=enc_id,
+                patient_id=uuid4(),
+                condition="Hypertension",
+                icd_code="I10",
+                occurred_at=datetime.now(timezone.utc),
+                performed_by=uuid4(),
+                performer_role="physician",
+                organization_id=uuid4(),
+                facility_id=uuid4(),
+                device_id="device-001",
+                connection_status=ConnectionStatus.ONLINE,
+                correlation_id=uuid4(),
+            )
+
+        diag_id = uuid4()
+        assert len(handler.handle(command(diag_id), aggregate_id=diag_id)) == 1
+
+        dispatcher.dispatch(_encounter_event("EncounterCompleted", enc_id, 3))
+        other_id = uuid4()
+        with pytest.raises(DomainError, match="not active"):
+            handler.handle(command(other_id), aggregate_id=other_id)
@@ -24,6 +24,10 @@ from uuid import UUID, uuid4
 import pytest
 
 from clinical_core.domain.events import (
+    DIAGNOSIS_CONFIRMED,
+    ENCOUNTER_BEGAN,
+    PATIENT_CHECKED_IN,
+    VITAL_SIGNS_RECORDED,
     ConnectionStatus,
     DomainEvent,
     EventMetadata,
@@ -48,6 +52,10 @@ _NURSE_ID = uuid4()
 _ENCOUNTER_ID = uuid4()
 _DIAGNOSIS_ID = uuid4()
 
+# Event metadata the scenario never inspects; built once, not per event.
+_CORRELATION_ID = uuid4()
+_OCCURRED_AT = datetime.now(timezone.utc)
+
 
 # ---------------------------------------------------------------------------
 # Event factory
@@ -71,14 +79,14 @@ def _clinical_event(
             aggregate_id=aggregate_id,
             aggregate_type=aggregate_type,
             aggregate_version=version,
-            occurred_at=datetime.now(timezone.utc),
+            occurred_at=_OCCURRED_AT,
             performed_by=performed_by or _DOCTOR_ID,
             performer_role=performer_role,
             organization_id=_ORG_ID,
             facility_id=_FACILITY_ID,
             device_id=device_id,
             connection_status=ConnectionStatus.ONLINE,
-            correlation_id=uuid4(),
+            correlation_id=_CORRELATION_ID,
         ),
         payload=payload,
     )
@@ -122,7 +130,7 @@ def _patient_summary_mapper(
         ],
         "vitals": [
             {
-                "recorded_at": v["recorded_at"],
+                "recorded_at": v["recorded_at"].isoformat(),
                 "readings": v["readings"],
                 "patient_id": v.get("patient_id"),
                 "encounter_id": v.get("encounter_id"),
@@ -190,36 +198,37 @@ def _execute_clinical_scenario() -> tuple[
     cmd_gw, qry_gw, store, dispatcher, projection = _wire_full_system()
 
     # ── Step 1: Start encounter ─────────────────────────────────────
-    # Patient checks in
-    store.append(_clinical_event(
-        aggregate_id=_ENCOUNTER_ID,
-        aggregate_type="Encounter",
-        event_type="clinical.encounter.PatientCheckedIn",
-        version=1,
-        payload={"patient_id": str(_PATIENT_ID)},
-        performed_by=_NURSE_ID,
-        performer_role="nurse",
-        device_id="front-desk-workstation",
-    ))
-
-    # Encounter begins (doctor enters room)
-    store.append(_clinical_event(
-        aggregate_id=_ENCOUNTER_ID,
-        aggregate_type="Encounter",
-        event_type="clinical.encounter.EncounterBegan",
-        version=2,
-        payload={
-            "patient_id": str(_PATIENT_ID),
-            "practitioner_id": str(_DOCTOR_ID),
-        },
-    ))
+    store.append_many([
+        # Patient checks in
+        _clinical_event(
+            aggregate_id=_ENCOUNTER_ID,
+            aggregate_type="Encounter",
+            event_type=PATIENT_CHECKED_IN,
+            version=1,
+            payload={"patient_id": str(_PATIENT_ID)},
+            performed_by=_NURSE_ID,
+            performer_role="nurse",
+            device_id="front-desk-workstation",
+        ),
+        # Encounter begins (doctor enters room)
+        _clinical_event(
+            aggregate_id=_ENCOUNTER_ID,
+            aggregate_type="Encounter",
+            event_type=ENCOUNTER_BEGAN,
+            version=2,
+            payload={
+                "patient_id": str(_PATIENT_ID),
+                "practitioner_id": str(_DOCTOR_ID),
+            },
+        ),
+    ])
 
     # ── Step 2: Record observation ──────────────────────────────────
     # Nurse records vital signs
     vitals_event = _clinical_event(
         aggregate_id=uuid4(),
         aggregate_type="Observation",
-        event_type="clinical.observation.VitalSignsRecorded",
+        event_type=VITAL_SIGNS_RECORDED,
         version=1,
         payload={
             "patient_id": str(_PATIENT_ID),
@@ -263,6 +272,13 @@ def _execute_clinical_scenario() -> tuple[
     return cmd_gw, qry_gw, store, dispatcher, projection, diag_result
 
 
+# The scenario runs once per module: the tests below only read the store,
+# query the projection and inspect results, so they can share one run.
+@pytest.fixture(scope="module")
+def scenario():
+    return _execute_clinical_scenario()
+
+
 # ---------------------------------------------------------------------------
 # Tests: Step verification
 # ---------------------------------------------------------------------------
@@ -270,40 +286,42 @@ def _execute_clinical_scenario() -> tuple[
 class TestClinicalFlowSteps:
     """Verify each step of the clinical flow executed correctly."""
 
-    def test_encounter_started(self) -> None:
-        _, _, store, _, _, _ = _execute_clinical_scenario()
+    def test_encounter_started(self, scenario) -> None:
+        _, _, store, _, _, _ = scenario
 
         stream = store.read_stream(_ENCOUNTER_ID)
         event_types = [e.event_type for e in stream]
 
-        assert "clinical.encounter.PatientCheckedIn" in event_types
-        assert "clinical.encounter.EncounterBegan" in event_types
+        assert PATIENT_CHECKED_IN in event_types
+        assert ENCOUNTER_BEGAN in event_types
 
-    def test_observation_recorded(self) -> None:
-        _, _, store, _, _, _ = _execute_clinical_scenario()
+    def test_observation_recorded(self, scenario) -> None:
+        _, _, store, _, _, _ = scenario
 
         all_events = store.read_all_events()
         vitals_events = [
             e for e in all_events
-            if e.event_type == "clinical.observation.VitalSignsRecorded"
+            if e.event_type == VITAL_SIGNS_RECORDED
         ]
 
         assert len(vitals_events) == 1
         assert vitals_events[0].payload["readings"]["systolic_bp"] == 158
 
-    def test_diagnosis_confirmed(self) -> None:
-        _, _, _, _, _, diag_result = _execute_clinical_scenario()
+    def test_diagnosis_confirmed(self, scenario) -> None:
+        _, _, _, _, _, diag_result = scenario
 
         assert diag_result.success is True
         assert len(diag_result.events) == 1
-        assert diag_result.events[0].event_type == "clinical.judgment.DiagnosisConfirmed"
+        assert diag_result.events[0].event_type == DIAGNOSIS_CONFIRMED
+        # The built event shares the interned constant the tables are keyed by.
+        assert diag_result.events[0].event_type is DIAGNOSIS_CONFIRMED
 
-    def test_diagnosis_persisted(self) -> None:
-        _, _, store, _, _, _ = _execute_clinical_scenario()
+    def test_diagnosis_persisted(self, scenario) -> None:
+        _, _, store, _, _, _ = scenario
 
         stream = store.read_stream(_DIAGNOSIS_ID)
         assert len(stream) == 1
-        assert stream[0].event_type == "clinical.judgment.DiagnosisConfirmed"
+        assert stream[0].event_type == DIAGNOSIS_CONFIRMED
 
 
 # ---------------------------------------------------------------------------
@@ -314,8 +332,8 @@ class TestProjectionReflectsClinicalReality:
     """After the full clinical flow, the patient summary must reflect
     what actually happened to the patient."""
 
-    def test_projection_has_diagnosis(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_projection_has_diagnosis(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
@@ -325,8 +343,8 @@ class TestProjectionReflectsClinicalReality:
         assert conditions[0]["condition"] == "Essential Hypertension"
         assert conditions[0]["icd_code"] == "I10"
 
-    def test_projection_has_vitals(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_projection_has_vitals(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
@@ -339,34 +357,43 @@ class TestProjectionReflectsClinicalReality:
         assert readings["heart_rate"] == 82
         assert readings["temperature_f"] == 98.6
 
-    def test_vitals_linked_to_encounter(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_vitals_recorded_at_formatted_by_mapper(self, scenario) -> None:
+        _, qry_gw, _, _, projection, _ = scenario
+
+        result = qry_gw.handle({"query_type": "PatientSummary"})
+
+        raw = projection.state["vitals"][0]["recorded_at"]
+        assert isinstance(raw, datetime)
+        assert result.data["vitals"][0]["recorded_at"] == raw.isoformat()
+
+    def test_vitals_linked_to_encounter(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
         vitals = result.data["vitals"]
         assert vitals[0]["encounter_id"] == str(_ENCOUNTER_ID)
 
-    def test_vitals_linked_to_patient(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_vitals_linked_to_patient(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
         vitals = result.data["vitals"]
         assert vitals[0]["patient_id"] == str(_PATIENT_ID)
 
-    def test_diagnosis_linked_to_patient(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_diagnosis_linked_to_patient(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
         condition = result.data["active_conditions"][0]
         assert condition["patient_id"] == str(_PATIENT_ID)
 
-    def test_clinical_picture_is_coherent(self) -> None:
+    def test_clinical_picture_is_coherent(self, scenario) -> None:
         """The projection tells a coherent clinical story:
         elevated BP → hypertension diagnosis."""
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
@@ -378,8 +405,8 @@ class TestProjectionReflectsClinicalReality:
         conditions = result.data["active_conditions"]
         assert any(c["condition"] == "Essential Hypertension" for c in conditions)
 
-    def test_query_response_is_complete(self) -> None:
-        _, qry_gw, _, _, _, _ = _execute_clinical_scenario()
+    def test_query_response_is_complete(self, scenario) -> None:
+        _, qry_gw, _, _, _, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
@@ -390,9 +417,9 @@ class TestProjectionReflectsClinicalReality:
         assert "stopped_treatments" in result.data
         assert "vitals" in result.data
 
-    def test_projection_matches_raw_state(self) -> None:
+    def test_projection_matches_raw_state(self, scenario) -> None:
         """QueryGateway response is consistent with raw projection state."""
-        _, qry_gw, _, _, projection, _ = _execute_clinical_scenario()
+        _, qry_gw, _, _, projection, _ = scenario
 
         result = qry_gw.handle({"query_type": "PatientSummary"})
 
@@ -402,9 +429,9 @@ class TestProjectionReflectsClinicalReality:
         assert len(result.data["active_conditions"]) == len(raw_conditions)
         assert len(result.data["vitals"]) == len(raw_vitals)
 
-    def test_projection_rebuildable(self) -> None:
+    def test_projection_rebuildable(self, scenario) -> None:
         """Projection can be rebuilt from event store and produce same state."""
-        _, qry_gw, store, _, projection, _ = _execute_clinical_scenario()
+        _, qry_gw, store, _, projection, _ = scenario
 
         original_state = dict(projection.state)
 
@@ -128,6 +128,23 @@ class TestSubscription:
 
         assert len(handler.received) == 2
 
+    def test_subscribe_all_registers_each_type(self) -> None:
+        from clinical_core.application.event_dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher()
+        handler = SpyHandler()
+
+        dispatcher.subscribe_all(
+            ["clinical.encounter.EncounterBegan", "clinical.encounter.EncounterCompleted"],
+            handler,
+        )
+
+        dispatcher.dispatch(_make_event(event_type="clinical.encounter.EncounterBegan"))
+        dispatcher.dispatch(_make_event(event_type="clinical.encounter.EncounterCompleted"))
+        dispatcher.dispatch(_make_event(event_type="clinical.encounter.PatientDischarged"))
+
+        assert len(handler.received) == 2
+
     def test_dispatch_with_no_subscribers_is_silent(self) -> None:
         from clinical_core.application.event_dispatcher import EventDispatcher
 
@@ -188,6 +205,23 @@ class TestDispatch:
 
         assert len(good_handler.received) == 1
 
+    def test_handler_subscribed_during_dispatch_waits_for_next_event(self) -> None:
+        from clinical_core.application.event_dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher()
+        late = SpyHandler()
+
+        def subscribing_handler(event: DomainEvent) -> None:
+            dispatcher.subscribe("clinical.test.EventA", late)
+
+        dispatcher.subscribe("clinical.test.EventA", subscribing_handler)
+
+        dispatcher.dispatch(_make_event(event_type="clinical.test.EventA"))
+        assert late.received == []
+
+        dispatcher.dispatch(_make_event(event_type="clinical.test.EventA"))
+        assert len(late.received) == 1
+
 
 # ---------------------------------------------------------------------------
 # Tests: Deterministic ordering per stream
@@ -248,3 +282,36 @@ class TestDeterministicOrdering:
 
         dispatcher.dispatch_batch([])
         assert len(handler.received) == 0
+
+    def test_dispatch_batch_groups_aggregates_by_first_appearance(self) -> None:
+        from clinical_core.application.event_dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher()
+        handler = SpyHandler()
+        dispatcher.subscribe("clinical.test.EventA", handler)
+
+        agg_a = uuid4()
+        agg_b = uuid4()
+        a1 = _make_event(event_type="clinical.test.EventA", aggregate_id=agg_a, aggregate_version=1)
+        b1 = _make_event(event_type="clinical.test.EventA", aggregate_id=agg_b, aggregate_version=1)
+        a2 = _make_event(event_type="clinical.test.EventA", aggregate_id=agg_a, aggregate_version=2)
+
+        dispatcher.dispatch_batch([a1, b1, a2])
+
+        assert handler.received == [a1, a2, b1]
+
+    def test_dispatch_batch_skips_unsubscribed_types(self) -> None:
+        from clinical_core.application.event_dispatcher import EventDispatcher
+
+        dispatcher = EventDispatcher()
+        handler = SpyHandler()
+        dispatcher.subscribe("clinical.test.EventA", handler)
+
+        agg_id = uuid4()
+        a2 = _make_event(event_type="clinical.test.EventA", aggregate_id=agg_id, aggregate_version=2)
+        b3 = _make_event(event_type="clinical.test.EventB", aggregate_id=agg_id, aggregate_version=3)
+        a1 = _make_event(event_type="clinical.test.EventA", aggregate_id=agg_id, aggregate_version=1)
+
+        dispatcher.dispatch_batch([a2, b3, a1])
+
+        assert handler.received == [a1, a2]
@@ -16,6 +16,10 @@ Invariants tested:
 
 from __future__ import annotations
 
+import copy
+import json
+import pickle
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from uuid import UUID, uuid4
 
@@ -206,6 +210,23 @@ class TestAppendOnlyImmutability:
         with pytest.raises(AttributeError):
             result.payload = {"tampered": True}  # type: ignore[misc]
 
+    def test_persisted_payload_is_a_plain_dict(self) -> None:
+        """Stored payloads serialize and copy like the dicts they were built from."""
+        store = InMemoryEventStore()
+        result = store.append(_make_event(payload={"finding": "clear lungs"}))
+
+        assert type(result.payload) is dict
+        assert json.loads(json.dumps(result.payload)) == {"finding": "clear lungs"}
+        assert pickle.loads(pickle.dumps(result)).payload == {"finding": "clear lungs"}
+        assert copy.deepcopy(result).payload == {"finding": "clear lungs"}
+
+    def test_metadata_strings_are_stored_as_given(self) -> None:
+        """Interning happens where events are built, not on every construction."""
+        built = "".join(["clinical.encounter.", "EncounterBegan"])
+        result = InMemoryEventStore().append(_make_event(event_type=built))
+
+        assert result.event_type is built
+
 
 # ---------------------------------------------------------------------------
 # Idempotent append (deduplication by event_id)
@@ -242,6 +263,119 @@ class TestIdempotentAppend:
         assert len(stream) == 1
 
 
+# ---------------------------------------------------------------------------
+# Batch append
+# ---------------------------------------------------------------------------
+
+class TestAppendMany:
+    """append_many applies the append rules to a batch, all-or-nothing."""
+
+    def test_appends_all_events_in_order(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = _make_stream_events(agg_id, 3)
+
+        result = store.append_many(events)
+
+        assert [e.event_id for e in result] == [e.event_id for e in events]
+        assert [e.aggregate_version for e in store.read_stream(agg_id)] == [1, 2, 3]
+
+    def test_continues_existing_stream(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = _make_stream_events(agg_id, 4)
+
+        store.append(events[0])
+        store.append_many(events[1:])
+
+        assert store.stream_version(agg_id) == 4
+
+    def test_batch_may_span_streams(self) -> None:
+        store = InMemoryEventStore()
+        agg_a = uuid4()
+        agg_b = uuid4()
+
+        store.append_many([
+            _make_event(aggregate_id=agg_a, aggregate_version=1),
+            _make_event(aggregate_id=agg_b, aggregate_version=1),
+            _make_event(aggregate_id=agg_a, aggregate_version=2),
+        ])
+
+        assert store.stream_version(agg_a) == 2
+        assert store.stream_version(agg_b) == 1
+
+    def test_version_conflict_stores_nothing(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        batch = [
+            _make_event(aggregate_id=agg_id, aggregate_version=1),
+            _make_event(aggregate_id=agg_id, aggregate_version=3),
+        ]
+
+        with pytest.raises(ConcurrencyError) as exc_info:
+            store.append_many(batch)
+
+        assert exc_info.value.expected_version == 2
+        assert store.read_stream(agg_id) == ()
+        assert not store.event_exists(batch[0].event_id)
+
+    def test_duplicates_return_existing_events(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        first, second = _make_stream_events(agg_id, 2)
+        stored_first = store.append(first)
+
+        result = store.append_many([first, second, second])
+
+        assert result[0] is stored_first
+        assert result[1] is result[2]
+        assert store.stream_version(agg_id) == 2
+
+    def test_batch_shares_recorded_at(self) -> None:
+        store = InMemoryEventStore()
+        result = store.append_many(_make_stream_events(uuid4(), 3))
+
+        assert len({e.recorded_at for e in result}) == 1
+        assert result[0].recorded_at is not None
+
+    def test_empty_batch_is_noop(self) -> None:
+        store = InMemoryEventStore()
+        assert store.append_many([]) == []
+        assert store.read_all_events() == []
+
+    def test_expected_version_matches(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = _make_stream_events(agg_id, 3)
+        store.append(events[0])
+
+        store.append_many(events[1:], expected_version=1)
+
+        assert store.stream_version(agg_id) == 3
+
+    def test_stale_expected_version_raises_before_validation(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        store.append_many(_make_stream_events(agg_id, 2))
+        stale = _make_event(aggregate_id=agg_id, aggregate_version=2)
+
+        with pytest.raises(ConcurrencyError) as exc_info:
+            store.append_many([stale], expected_version=1)
+
+        assert exc_info.value.expected_version == 1
+        assert exc_info.value.actual_version == 2
+
+    def test_expected_version_allows_idempotent_retry(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = _make_stream_events(agg_id, 2)
+        first = store.append_many(events, expected_version=0)
+
+        retried = store.append_many(events, expected_version=0)
+
+        assert retried == first
+
+
 # ---------------------------------------------------------------------------
 # recorded_at is set by the store
 # ---------------------------------------------------------------------------
@@ -280,7 +414,7 @@ class TestStreamReading:
 
     def test_empty_stream_returns_empty_list(self) -> None:
         store = InMemoryEventStore()
-        assert store.read_stream(uuid4()) == []
+        assert store.read_stream(uuid4()) == ()
 
     def test_read_stream_from_returns_subset(self) -> None:
         store = InMemoryEventStore()
@@ -298,7 +432,36 @@ class TestStreamReading:
         agg_id = uuid4()
         store.append(_make_event(aggregate_id=agg_id, aggregate_version=1))
 
-        assert store.read_stream_from(agg_id, from_version=99) == []
+        assert store.read_stream_from(agg_id, from_version=99) == ()
+
+    def test_iter_stream_yields_stream_in_chunks(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        store.append_many(_make_stream_events(agg_id, 5))
+
+        chunked = store.iter_stream(agg_id, chunk_size=2)
+
+        assert tuple(chunked) == store.read_stream(agg_id)
+        assert list(store.iter_stream(uuid4())) == []
+
+    def test_read_stream_is_a_snapshot_unaffected_by_later_appends(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = _make_stream_events(agg_id, 3)
+        store.append_many(events[:2])
+
+        snapshot = store.read_stream(agg_id)
+        store.append(events[2])
+
+        assert [e.aggregate_version for e in snapshot] == [1, 2]
+        assert len(store.read_stream(agg_id)) == 3
+
+    def test_read_stream_from_version_0_returns_whole_stream(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        store.append_many(_make_stream_events(agg_id, 2))
+
+        assert store.read_stream_from(agg_id, from_version=0) == store.read_stream(agg_id)
 
     def test_stream_version_returns_0_for_unknown_aggregate(self) -> None:
         store = InMemoryEventStore()
@@ -363,3 +526,62 @@ class TestReadAllEvents:
     def test_empty_store_returns_empty(self) -> None:
         store = InMemoryEventStore()
         assert store.read_all_events() == []
+
+    def test_read_all_from_position_returns_later_events(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+        events = store.append_many(_make_stream_events(agg_id, 3))
+
+        assert store.read_all_events_from(1) == events[1:]
+        assert store.read_all_events_from(3) == []
+
+    def test_event_count_matches_read_all(self) -> None:
+        store = InMemoryEventStore()
+        assert store.event_count() == 0
+
+        store.append_many(_make_stream_events(uuid4(), 2))
+        store.append(_make_event(aggregate_id=uuid4(), aggregate_version=1))
+
+        assert store.event_count() == len(store.read_all_events()) == 3
+
+    def test_read_all_filtered_by_aggregate_type_keeps_order(self) -> None:
+        store = InMemoryEventStore()
+        enc_a, enc_b, diag = uuid4(), uuid4(), uuid4()
+
+        first = store.append(_make_event(aggregate_id=enc_a, aggregate_version=1))
+        store.append(_make_event(
+            aggregate_id=diag, aggregate_version=1, aggregate_type="Diagnosis",
+        ))
+        second = store.append(_make_event(aggregate_id=enc_b, aggregate_version=1))
+
+        assert store.read_all_events({"Encounter"}) == [first, second]
+        assert store.read_all_events({"Encounter", "Diagnosis"}) == store.read_all_events()
+        assert store.read_all_events({"Unknown"}) == []
+
+
+# ---------------------------------------------------------------------------
+# Concurrent appends
+# ---------------------------------------------------------------------------
+
+class TestConcurrentAppends:
+
+    def test_racing_appends_to_one_stream_yield_contiguous_versions(self) -> None:
+        store = InMemoryEventStore()
+        agg_id = uuid4()
+
+        def append_next() -> None:
+            while True:
+                version = store.stream_version(agg_id) + 1
+                try:
+                    store.append(_make_event(aggregate_id=agg_id, aggregate_version=version))
+                    return
+                except ConcurrencyError:
+                    continue
+
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            for future in [pool.submit(append_next) for _ in range(200)]:
+                future.result()
+
+        versions = [e.aggregate_version for e in store.read_stream(agg_id)]
+        assert versions == list(range(1, 201))
+        assert store.event_count() == 200
@@ -141,14 +141,16 @@ def _wire_system() -> tuple[
 
 def _setup_active_encounter(store: InMemoryEventStore) -> UUID:
     enc_id = uuid4()
-    store.append(_encounter_event(
-        enc_id, "clinical.encounter.PatientCheckedIn", 1,
-        {"patient_id": str(_PATIENT_ID)},
-    ))
-    store.append(_encounter_event(
-        enc_id, "clinical.encounter.EncounterBegan", 2,
-        {"practitioner_id": str(_DOCTOR_ID)},
-    ))
+    store.append_many([
+        _encounter_event(
+            enc_id, "clinical.encounter.PatientCheckedIn", 1,
+            {"patient_id": str(_PATIENT_ID)},
+        ),
+        _encounter_event(
+            enc_id, "clinical.encounter.EncounterBegan", 2,
+            {"practitioner_id": str(_DOCTOR_ID)},
+        ),
+    ])
     return enc_id
 
 
@@ -24,6 +24,7 @@ from clinical_core.domain.events import (
     DomainEvent,
     EventMetadata,
 )
+from clinical_core.infrastructure.in_memory_event_store import InMemoryEventStore
 
 
 # ---------------------------------------------------------------------------
@@ -181,6 +182,35 @@ class TestRebuild:
         assert proj.state == {"clinical.test.EventA": 1}
 
 
+# ---------------------------------------------------------------------------
+# Tests: Catch-up from the checkpoint
+# ---------------------------------------------------------------------------
+
+class TestCatchUp:
+
+    def test_catch_up_applies_only_new_events(self) -> None:
+        event_store = InMemoryEventStore()
+        proj = CounterProjection()
+        event_store.append(_make_event(event_type="clinical.test.EventA"))
+        proj.catch_up(event_store)
+
+        event_store.append(_make_event(event_type="clinical.test.EventB"))
+        proj.catch_up(event_store)
+
+        assert proj.state == {"clinical.test.EventA": 1, "clinical.test.EventB": 1}
+        assert proj.checkpoint == 2
+
+    def test_catch_up_skips_events_already_handled(self) -> None:
+        event_store = InMemoryEventStore()
+        proj = CounterProjection()
+        proj.handle(event_store.append(_make_event(event_type="clinical.test.EventA")))
+
+        proj.catch_up(event_store)
+
+        assert proj.state == {"clinical.test.EventA": 1}
+        assert proj.checkpoint == 1
+
+
 # ---------------------------------------------------------------------------
 # Tests: Stateless processing
 # ---------------------------------------------------------------------------
@@ -204,3 +234,212 @@ class TestStatelessProcessing:
     def test_initial_state_is_empty(self) -> None:
         proj = CounterProjection()
         assert proj.state == {}
+
+
+# ---------------------------------------------------------------------------
+# Tests: Snapshots
+# ---------------------------------------------------------------------------
+
+class _DictSnapshotStore:
+    def __init__(self) -> None:
+        self.saved: dict[str, list] = {}
+
+    def load(self, name: str):
+        return self.saved[name][-1] if name in self.saved else None
+
+    def save(self, name: str, snapshot) -> None:
+        self.saved.setdefault(name, []).append(snapshot)
+
+
+class TestSnapshots:
+
+    def test_snapshot_captures_state_and_checkpoint(self) -> None:
+        proj = CounterProjection()
+        proj.rebuild_from([_make_event(event_type="clinical.test.EventA"), _make_event()])
+
+        snapshot = proj.save_snapshot()
+        assert snapshot.state == {"clinical.test.EventA": 2}
+        assert snapshot.checkpoint == 2
+        assert len(snapshot.processed_event_ids) == 2
+
+    def test_snapshot_records_events_handled_live(self) -> None:
+        proj = CounterProjection()
+        event = _make_event(event_type="clinical.test.EventA")
+        proj.handle(event)
+
+        snapshot = proj.save_snapshot()
+        assert snapshot.checkpoint == 0
+        assert snapshot.processed_event_ids == {event.event_id}
+
+    @pytest.mark.parametrize("dedupe_by_version", [False, True], ids=["by_event_id", "by_version"])
+    def test_restored_projection_skips_redelivered_event(self, dedupe_by_version) -> None:
+        event_store = InMemoryEventStore()
+        proj = CounterProjection(dedupe_by_version=dedupe_by_version)
+        event = event_store.append(_make_event(event_type="clinical.test.EventA"))
+        proj.handle(event)
+        proj.catch_up(event_store)
+
+        restored = CounterProjection(dedupe_by_version=dedupe_by_version)
+        restored.load_snapshot(proj.save_snapshot())
+        restored.handle(event)
+
+        assert restored.state == {"clinical.test.EventA": 1}
+
+    def test_snapshot_is_not_affected_by_later_events(self) -> None:
+        proj = CounterProjection()
+        proj.handle(_make_event(event_type="clinical.test.EventA"))
+        snapshot = proj.save_snapshot()
+
+        proj.handle(_make_event(event_type="clinical.test.EventA"))
+        assert snapshot.state == {"clinical.test.EventA": 1}
+
+    def test_load_snapshot_restores_state(self) -> None:
+        proj = CounterProjection()
+        proj.handle(_make_event(event_type="clinical.test.EventA"))
+        snapshot = proj.save_snapshot()
+
+        fresh = CounterProjection()
+        fresh.load_snapshot(snapshot)
+        assert fresh.state == proj.state
+
+    def test_rebuild_from_snapshot_applies_only_tail(self) -> None:
+        events = [
+            _make_event(event_type="clinical.test.EventA"),
+            _make_event(event_type="clinical.test.EventA"),
+            _make_event(event_type="clinical.test.EventB"),
+        ]
+        proj = CounterProjection()
+        proj.rebuild_from(events[:2])
+        snapshot = proj.save_snapshot()
+
+        fresh = CounterProjection()
+        fresh.rebuild_from(events, snapshot=snapshot)
+        assert fresh.state == {"clinical.test.EventA": 2, "clinical.test.EventB": 1}
+
+    def test_rebuild_from_snapshot_matches_full_rebuild(self) -> None:
+        events = [_make_event(event_type="clinical.test.EventA") for _ in range(5)]
+        full = CounterProjection()
+        full.rebuild_from(events)
+
+        partial = CounterProjection()
+        partial.rebuild_from(events[:3])
+        resumed = CounterProjection()
+        resumed.rebuild_from(events, snapshot=partial.save_snapshot())
+
+        assert resumed.state == full.state
+
+    def test_snapshot_saved_periodically_on_catch_up(self) -> None:
+        event_store = InMemoryEventStore()
+        store = _DictSnapshotStore()
+        proj = CounterProjection(snapshot_store=store, snapshot_every=2)
+
+        for _ in range(5):
+            event_store.append(_make_event(event_type="clinical.test.EventA"))
+            proj.catch_up(event_store)
+
+        snapshots = store.saved["CounterProjection"]
+        assert [(s.state, s.checkpoint) for s in snapshots] == [
+            ({"clinical.test.EventA": 2}, 2),
+            ({"clinical.test.EventA": 4}, 4),
+        ]
+
+    @pytest.mark.parametrize("dedupe_by_version", [False, True], ids=["by_event_id", "by_version"])
+    def test_resume_from_stored_snapshot_matches_full_rebuild(self, dedupe_by_version) -> None:
+        event_store = InMemoryEventStore()
+        snapshots = _DictSnapshotStore()
+        agg_id = uuid4()
+        event_types = ["clinical.test.EventA", "clinical.test.EventB"] * 3
+
+        def append(version):
+            return event_store.append(_make_event(
+                event_type=event_types[version - 1], aggregate_id=agg_id, aggregate_version=version,
+            ))
+
+        proj = CounterProjection(snapshot_store=snapshots, dedupe_by_version=dedupe_by_version)
+        for version in (1, 2, 3):
+            append(version)
+        proj.catch_up(event_store)
+        # Handled live past the checkpoint, then snapshotted before a catch-up.
+        proj.handle(append(4))
+        snapshots.save(proj.projection_name, proj.save_snapshot())
+        for version in (5, 6):
+            append(version)
+
+        resumed = CounterProjection(dedupe_by_version=dedupe_by_version)
+        resumed.load_snapshot(snapshots.load(resumed.projection_name))
+        resumed.catch_up(event_store)
+
+        full = CounterProjection(dedupe_by_version=dedupe_by_version)
+        full.rebuild_from(event_store.read_all_events())
+        assert resumed.state == full.state == {"clinical.test.EventA": 3, "clinical.test.EventB": 3}
+        assert resumed.checkpoint == full.checkpoint == 6
+
+    def test_handle_does_not_save_snapshots(self) -> None:
+        store = _DictSnapshotStore()
+        proj = CounterProjection(snapshot_store=store, snapshot_every=1)
+
+        proj.handle(_make_event(event_type="clinical.test.EventA"))
+
+        assert store.saved == {}
+
+    def test_rebuild_saves_one_snapshot_at_end(self) -> None:
+        store = _DictSnapshotStore()
+        proj = CounterProjection(snapshot_store=store, snapshot_every=2)
+
+        proj.rebuild_from([_make_event(event_type="clinical.test.EventA") for _ in range(5)])
+
+        snapshots = store.saved["CounterProjection"]
+        assert [s.state for s in snapshots] == [{"clinical.test.EventA": 5}]
+
+    def test_no_snapshot_without_store(self) -> None:
+        proj = CounterProjection()
+        for _ in range(150):
+            proj.handle(_make_event(event_type="clinical.test.EventA"))
+        assert proj.state == {"clinical.test.EventA": 150}
+
+
+# ---------------------------------------------------------------------------
+# Tests: Version-based deduplication
+# ---------------------------------------------------------------------------
+
+class TestDedupeByVersion:
+
+    def test_redelivered_event_is_skipped(self) -> None:
+        proj = CounterProjection(dedupe_by_version=True)
+        event = _make_event(event_type="clinical.test.EventA")
+
+        proj.handle(event)
+        proj.handle(event)
+
+        assert proj.state == {"clinical.test.EventA": 1}
+
+    def test_event_at_or_below_applied_version_is_skipped(self) -> None:
+        proj = CounterProjection(dedupe_by_version=True)
+        agg_id = uuid4()
+
+        proj.handle(_make_event(aggregate_id=agg_id, aggregate_version=1))
+        proj.handle(_make_event(aggregate_id=agg_id, aggregate_version=2))
+        proj.handle(_make_event(aggregate_id=agg_id, aggregate_version=2))
+
+        assert proj.state == {"clinical.test.EventA": 2}
+
+    def test_event_ids_are_not_retained(self) -> None:
+        proj = CounterProjection(dedupe_by_version=True)
+        agg_id = uuid4()
+        for version in range(1, 6):
+            proj.handle(_make_event(aggregate_id=agg_id, aggregate_version=version))
+
+        snapshot = proj.save_snapshot()
+        assert snapshot.processed_event_ids == frozenset()
+        assert snapshot.applied_versions == {agg_id: 5}
+
+    def test_rebuild_from_snapshot_applies_only_tail(self) -> None:
+        agg_id = uuid4()
+        events = [_make_event(aggregate_id=agg_id, aggregate_version=v) for v in (1, 2, 3)]
+        proj = CounterProjection(dedupe_by_version=True)
+        proj.rebuild_from(events[:2])
+        snapshot = proj.save_snapshot()
+
+        fresh = CounterProjection(dedupe_by_version=True)
+        fresh.rebuild_from(events, snapshot=snapshot)
+        assert fresh.state == {"clinical.test.EventA": 3}
@@ -314,6 +314,55 @@ class TestReturnResult:
         assert result3.success is False
 
 
+# ---------------------------------------------------------------------------
+# Tests: Fresh responses
+# ---------------------------------------------------------------------------
+
+class TestFreshResponses:
+
+    def test_mutating_a_response_does_not_affect_later_queries(self) -> None:
+        gateway, _ = _build_query_gateway()
+
+        first = gateway.handle({"query_type": "PatientSummary"})
+        first.data["active_conditions"].clear()
+        second = gateway.handle({"query_type": "PatientSummary"})
+
+        assert len(second.data["active_conditions"]) == 2
+
+    def test_new_event_is_reflected_in_next_query(self) -> None:
+        gateway, projection = _build_query_gateway()
+
+        gateway.handle({"query_type": "PatientSummary"})
+        projection.handle(_diagnosis_event(uuid4(), "Asthma", "J45"))
+        result = gateway.handle({"query_type": "PatientSummary"})
+
+        assert len(result.data["active_conditions"]) == 3
+
+
+# ---------------------------------------------------------------------------
+# Tests: Trusted in-process queries
+# ---------------------------------------------------------------------------
+
+class TestHandleTrusted:
+
+    def test_returns_same_data_as_handle(self) -> None:
+        gateway, _ = _build_query_gateway()
+
+        trusted = gateway.handle_trusted("PatientSummary", {})
+        public = gateway.handle({"query_type": "PatientSummary"})
+
+        assert trusted.success is True
+        assert trusted.data == public.data
+
+    def test_unknown_query_type_fails(self) -> None:
+        gateway, _ = _build_query_gateway()
+
+        result = gateway.handle_trusted("NoSuchQuery", {})
+
+        assert result.success is False
+        assert "unknown" in result.error.lower()
+
+
 # ---------------------------------------------------------------------------
 # Tests: Architecture rule enforcement
 # ---------------------------------------------------------------------------
@@ -135,6 +135,38 @@ class TestSyncNodePosition:
         assert e2.event_id in ids
         assert len(ids) == 2
 
+    def test_position_tracks_events_appended_after_creation(self) -> None:
+        from clinical_core.sync.engine import SyncNode
+
+        store = InMemoryEventStore()
+        node = SyncNode(node_id="node-a", event_store=store, dispatcher=EventDispatcher())
+        assert node.event_count() == 0
+
+        e1 = store.append(_event("test.Created", uuid4(), 1))
+        assert node.event_count() == 1
+
+        e2 = store.append(_event("test.Created", uuid4(), 1))
+        assert node.known_event_ids() == {e1.event_id, e2.event_id}
+        assert node.all_events() == [e1, e2]
+
+    def test_nodes_with_same_stream_events_share_its_root(self) -> None:
+        from clinical_core.sync.engine import SyncNode
+
+        agg_id = uuid4()
+        e1 = _event("test.Created", agg_id, 1)
+        e2 = _event("test.Updated", agg_id, 2)
+        store_a = InMemoryEventStore()
+        store_b = InMemoryEventStore()
+        store_a.append_many([e1, e2])
+        store_b.append(e1)
+
+        node_a = SyncNode("node-a", store_a, EventDispatcher())
+        node_b = SyncNode("node-b", store_b, EventDispatcher())
+        assert node_a.stream_roots()[agg_id] != node_b.stream_roots()[agg_id]
+
+        store_b.append(e2)
+        assert node_a.stream_roots() == node_b.stream_roots()
+
 
 # ---------------------------------------------------------------------------
 # Tests: SyncEngine — missing event detection
@@ -201,6 +233,26 @@ class TestMissingEventDetection:
         missing = engine.detect_missing(source=node_a, target=node_b)
         assert len(missing) == 3
 
+    def test_detect_only_in_diverged_streams(self) -> None:
+        from clinical_core.sync.engine import SyncNode, SyncEngine
+
+        store_a = InMemoryEventStore()
+        store_b = InMemoryEventStore()
+        shared_id = uuid4()
+        diverged_id = uuid4()
+        shared = _event("test.Created", shared_id, 1)
+        store_a.append(shared)
+        store_b.append(shared)
+        store_a.append(_event("test.Created", diverged_id, 1))
+        new_event = store_a.append(_event("test.Updated", diverged_id, 2))
+        store_b.append(store_a.read_stream(diverged_id)[0])
+
+        node_a = SyncNode("node-a", store_a, EventDispatcher())
+        node_b = SyncNode("node-b", store_b, EventDispatcher())
+
+        missing = SyncEngine().detect_missing(source=node_a, target=node_b)
+        assert missing == [new_event]
+
 
 # ---------------------------------------------------------------------------
 # Tests: SyncEngine — event transfer